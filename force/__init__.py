@@ -7,6 +7,7 @@ constraint enforcement, learning data collection, and governance.
 """
 
 import os
+import re
 import json
 import logging
 import asyncio
@@ -36,6 +37,9 @@ except ImportError:
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Matches a whole-value "${name}" parameter template, capturing the context key
+TEMPLATE_PATTERN = re.compile(r"\$\{(.*)\}", re.DOTALL)
+
 class ForceEngineError(Exception):
     """Base exception for Force engine errors."""
     pass
@@ -64,15 +68,18 @@ class ForceEngine:
     _learning_module_imported = False
     _governance_module_imported = False
     
-    def __init__(self, force_directory: Optional[str] = None):
+    def __init__(self, force_directory: Optional[str] = None, max_subprocess_concurrency: Optional[int] = None):
         """
         Initialize the Force engine.
         
         Args:
             force_directory: Path to the .force directory. If None,
                            will search for it in standard locations.
+            max_subprocess_concurrency: Cap on subprocesses the tool executor
+                           runs at once. Defaults to the CPU count.
         """
         self.force_dir = self._find_force_directory(force_directory)
+        self.max_subprocess_concurrency = max_subprocess_concurrency
         self.schemas_dir = self.force_dir / "schemas"
         self.tools_dir = self.force_dir / "tools"
         self.patterns_dir = self.force_dir / "patterns"
@@ -662,6 +669,8 @@ class ForceEngine:
     async def cleanup(self) -> None:
         """Cleanup and persist any pending data."""
         await self._persist_learning_data()
+        # Stop the tool executor's long-lived git helper so it does not outlive the event loop
+        await self.tool_executor.aclose()
         logger.info("Force engine cleanup completed")
     
     def _initialize_modular_components(self):
@@ -714,7 +723,6 @@ class ForceEngine:
         try:
             # Import necessary modules
             from . import tools
-            from . import patterns
             from . import constraints
             
             # Load tool definitions from the .force directory
@@ -724,12 +732,8 @@ class ForceEngine:
             else:
                 logger.warning("Tool definition loader not available")
             
-            # Load pattern definitions
-            if hasattr(patterns, 'load_json_patterns'):
-                patterns.load_json_patterns()
-                logger.info("Loaded pattern definitions from .force directory")
-            else:
-                logger.warning("Pattern definition loader not available")
+            # Pattern definitions are registered into the engine-bound
+            # PatternRegistry by patterns.initialize()
             
             # Load constraint definitions
             if hasattr(constraints, 'load_constraint_definitions'):
@@ -906,8 +910,9 @@ class ForceEngine:
         """
         result = {}
         for key, value in params.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                context_key = value[2:-1]
+            match = TEMPLATE_PATTERN.fullmatch(value) if isinstance(value, str) else None
+            if match:
+                context_key = match.group(1)
                 if context_key in context:
                     result[key] = context[context_key]
                 else:
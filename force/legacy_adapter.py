@@ -7,18 +7,120 @@ backward compatibility and adding Force capabilities.
 """
 
 import os
+import sys
+import copy
 import json
 import logging
 import asyncio
-from typing import Dict, List, Any, Optional, Union, Type, Callable
+import functools
+from collections import deque
+from typing import Dict, List, Any, Optional, Union, Type, Callable, Mapping, Tuple
 from datetime import datetime, timezone
 from pathlib import Path
+from types import MappingProxyType
 
 from core.agent import BaseAgent
-from . import ForceEngine, ForceEngineError
+from . import ForceEngine, ForceEngineError, TEMPLATE_PATTERN
 
 logger = logging.getLogger(__name__)
 
+# Number of recent execution records retained for learning analytics
+LEARNING_DATA_LIMIT = 100
+
+# Number of compiled condition evaluators cached per adapter
+CONDITION_CACHE_LIMIT = 256
+
+
+def _interned_mapping(mapping: Mapping[str, Any]) -> Mapping[str, Any]:
+    """Return a read-only copy of a mapping with its string keys and values interned."""
+    return MappingProxyType({
+        sys.intern(key): sys.intern(value) if isinstance(value, str) else value
+        for key, value in mapping.items()
+    })
+
+
+# Base mappings that all agents support (extended by specific adapters)
+_BASE_CAPABILITY_MAPPING: Mapping[str, str] = _interned_mapping({
+    "status": "get_agent_status",
+    "health": "health_check",
+    "capabilities": "get_capabilities",
+    "initialize": "initialize_agent",
+})
+
+_BASE_TOOL_MAPPING: Mapping[str, Union[str, List[str]]] = _interned_mapping({
+    "git-status": ["git", "status"],
+    "git-log": ["git", "log"],
+    "file-read": ["filesystem", "read"],
+    "file-write": ["filesystem", "write"],
+})
+
+_BASE_PATTERN_MAPPING: Mapping[str, str] = _interned_mapping({
+    "analyze": "analysis-workflow",
+    "inspect": "inspection-workflow",
+    "monitor": "monitoring-workflow",
+})
+
+
+@functools.lru_cache(maxsize=1024)
+def _template_variable(value: str) -> Optional[str]:
+    """Return the context variable named by a ``${name}`` template, or None."""
+    match = TEMPLATE_PATTERN.fullmatch(value)
+    return match.group(1) if match else None
+
+
+ConditionEvaluator = Callable[[Dict[str, Any]], bool]
+
+
+def _condition_never(context: Dict[str, Any]) -> bool:
+    """Evaluator for malformed or unsupported conditions."""
+    return False
+
+
+def _compile_equals(field: str, value: Any) -> ConditionEvaluator:
+    """Build an evaluator checking that a context field equals the value."""
+    return lambda context: context.get(field) == value
+
+
+def _compile_exists(field: str, value: Any) -> ConditionEvaluator:
+    """Build an evaluator checking that a context field is present."""
+    return lambda context: field in context
+
+
+def _compile_greater_than(field: str, value: Any) -> ConditionEvaluator:
+    """Build an evaluator checking that a numeric context field exceeds the value."""
+    if not isinstance(value, (int, float)):
+        return _condition_never
+    
+    def evaluate(context: Dict[str, Any]) -> bool:
+        field_value = context.get(field, 0)
+        return isinstance(field_value, (int, float)) and field_value > value
+    
+    return evaluate
+
+
+# Condition evaluator factories keyed by condition type
+_CONDITION_COMPILERS: Dict[str, Callable[[str, Any], ConditionEvaluator]] = {
+    "equals": _compile_equals,
+    "exists": _compile_exists,
+    "greater_than": _compile_greater_than,
+}
+
+
+def _compile_condition(condition: Any) -> ConditionEvaluator:
+    """Read a condition definition once and return a closure evaluating it."""
+    if not isinstance(condition, dict):
+        return _condition_never
+    
+    cond_type = condition.get("type")
+    # Malformed definitions may carry an unhashable type such as a list
+    compiler = _CONDITION_COMPILERS.get(cond_type) if isinstance(cond_type, str) else None
+    field = condition.get("field")
+    if compiler is None or not field:
+        return _condition_never
+    
+    return compiler(field, condition.get("value"))
+
+
 class LegacyAgentManager:
     """
     Manager for all legacy agents with Force integration.
@@ -115,8 +217,32 @@ class LegacyAgentAdapter:
     - Constraint validation
     - Learning data collection
     - Legacy method compatibility
+    
+    Subclasses extend the base mappings by declaring ``_CAPABILITY_EXTRA``,
+    ``_TOOL_EXTRA`` and ``_PATTERN_EXTRA`` class attributes, which are merged
+    into read-only class-level mappings when the subclass is created.
     """
     
+    _CAPABILITY_EXTRA: Mapping[str, str] = {}
+    _TOOL_EXTRA: Mapping[str, Union[str, List[str]]] = {}
+    _PATTERN_EXTRA: Mapping[str, str] = {}
+    
+    _capability_mapping: Mapping[str, str] = _BASE_CAPABILITY_MAPPING
+    _tool_mapping: Mapping[str, Union[str, List[str]]] = _BASE_TOOL_MAPPING
+    _pattern_mapping: Mapping[str, str] = _BASE_PATTERN_MAPPING
+    
+    def __init_subclass__(cls, **kwargs):
+        """Merge the subclass mapping extensions over the inherited mappings."""
+        super().__init_subclass__(**kwargs)
+        for mapping_attr, extra_attr in (
+            ("_capability_mapping", "_CAPABILITY_EXTRA"),
+            ("_tool_mapping", "_TOOL_EXTRA"),
+            ("_pattern_mapping", "_PATTERN_EXTRA"),
+        ):
+            extra = cls.__dict__.get(extra_attr)
+            if extra:
+                setattr(cls, mapping_attr, _interned_mapping({**getattr(cls, mapping_attr), **extra}))
+    
     def __init__(self, agent: BaseAgent, force_engine: Optional[ForceEngine] = None):
         """
         Initialize the legacy adapter.
@@ -126,45 +252,26 @@ class LegacyAgentAdapter:
             force_engine: Optional Force engine instance
         """
         self.agent = agent
-        self.agent_type = type(agent).__name__
+        self.agent_type = sys.intern(type(agent).__name__)
         self.force_engine = force_engine or ForceEngine()
         
-        # Capability mapping
-        self._capability_mapping = {}
-        self._tool_mapping = {}
-        self._pattern_mapping = {}
-        
         # Performance tracking
         self._execution_history = []
-        self._learning_data = []
-        
-        # Initialize mappings
-        self._initialize_mappings()
-        
-    def _initialize_mappings(self):
-        """Initialize capability, tool, and pattern mappings for the agent."""
-        # Base mappings that all agents support
-        self._capability_mapping = {
-            "status": "get_agent_status",
-            "health": "health_check",
-            "capabilities": "get_capabilities",
-            "initialize": "initialize_agent",
-        }
+        self._duration_total = 0.0
+        self._duration_min = float("inf")
+        self._duration_max = 0.0
+        self._learning_data = deque(maxlen=LEARNING_DATA_LIMIT)
         
-        # Tool mappings (will be extended by specific adapters)
-        self._tool_mapping: Dict[str, Union[str, List[str]]] = {
-            "git-status": ["git", "status"],
-            "git-log": ["git", "log"],
-            "file-read": ["filesystem", "read"],
-            "file-write": ["filesystem", "write"],
-        }
+        # Parsed constraints in file order with the operations each applies to, the
+        # per-operation selections made from them, and the file stats they were built from
+        self._constraint_index: Optional[Tuple[List[Tuple[frozenset, Dict[str, Any]]], Dict[str, List[Dict[str, Any]]]]] = None
+        self._constraint_stats: Optional[Tuple[Tuple[str, int, int], ...]] = None
         
-        # Pattern mappings (will be extended by specific adapters)
-        self._pattern_mapping = {
-            "analyze": "analysis-workflow",
-            "inspect": "inspection-workflow",
-            "monitor": "monitoring-workflow",
-        }
+        # Compiled condition evaluators keyed by the condition's (type, field, value) contents
+        self._condition_evaluators: Dict[str, ConditionEvaluator] = {}
+        
+        # Engine tool executor method, bound on the first tool execution
+        self._execute_tool_command: Optional[Callable[..., Any]] = None
     
     async def execute_force_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -178,6 +285,8 @@ class LegacyAgentAdapter:
             Execution result with metadata
         """
         start_time = datetime.now(timezone.utc)
+        # Tool names key the usage counters built from the execution history
+        tool_name = sys.intern(tool_name)
         
         try:
             # Load tool definition
@@ -188,8 +297,12 @@ class LegacyAgentAdapter:
             # Validate parameters against tool schema
             await self._validate_tool_parameters(tool_def, parameters)
             
-            # Execute through Force engine
-            result = await self.force_engine.tool_executor.execute_tool_command(
+            # Execute through Force engine, binding the executor method on first use
+            execute_tool_command = self._execute_tool_command
+            if execute_tool_command is None:
+                execute_tool_command = self.force_engine.tool_executor.execute_tool_command
+                self._execute_tool_command = execute_tool_command
+            result = await execute_tool_command(
                 tool_def, parameters, context={"adapter": self.agent_type}
             )
             
@@ -204,7 +317,7 @@ class LegacyAgentAdapter:
                 "success": result.get("success", True)
             }
             
-            self._execution_history.append(execution_record)
+            self._record_execution(execution_record)
             self._learning_data.append(execution_record)
             
             return result
@@ -220,7 +333,7 @@ class LegacyAgentAdapter:
                 "success": False
             }
             
-            self._execution_history.append(error_record)
+            self._record_execution(error_record)
             logger.error(f"Force tool execution failed: {e}")
             
             return {
@@ -407,7 +520,7 @@ class LegacyAgentAdapter:
                 "success_rate": self._calculate_success_rate(),
                 "popular_tools": self._get_popular_tools(),
                 "performance_metrics": self._get_performance_metrics(),
-                "learning_records": self._learning_data[-100:],  # Last 100 records
+                "learning_records": list(self._learning_data),  # Last 100 records
                 "timestamp": datetime.now(timezone.utc).isoformat()
             }
             
@@ -471,64 +584,98 @@ class LegacyAgentAdapter:
         """Execute a single pattern step."""
         step_type = step.get("type")
         
-        if step_type == "tool":
-            tool_name = step.get("tool")
-            parameters = step.get("parameters", {})
-            
-            # Substitute context variables in parameters
-            resolved_params = self._resolve_context_variables(parameters, context)
-            
-            if tool_name:
-                return await self.execute_force_tool(tool_name, resolved_params)
-            else:
-                return {
-                    "success": False,
-                    "error": "Tool name not specified in step"
-                }
+        handler = self._STEP_HANDLERS.get(step_type)
+        if handler is None:
+            return {
+                "success": False,
+                "error": f"Unknown step type: {step_type}"
+            }
         
-        elif step_type == "condition":
-            # Evaluate condition
-            condition = step.get("condition")
-            if condition:
-                result = self._evaluate_condition(condition, context)
-                
-                return {
-                    "success": True,
-                    "condition_result": result,
-                    "output": {"condition_met": result}
-                }
-            else:
-                return {
-                    "success": False,
-                    "error": "No condition specified in step"
-                }
+        return await handler(self, step, context)
+    
+    async def _execute_tool_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a pattern step that runs a Force tool."""
+        tool_name = step.get("tool")
+        parameters = step.get("parameters", {})
         
+        # Substitute context variables in parameters
+        resolved_params = self._resolve_context_variables(parameters, context)
+        
+        if tool_name:
+            return await self.execute_force_tool(tool_name, resolved_params)
         else:
             return {
                 "success": False,
-                "error": f"Unknown step type: {step_type}"
+                "error": "Tool name not specified in step"
+            }
+    
+    async def _execute_condition_step(self, step: Dict[str, Any], context: Dict[str, Any]) -> Dict[str, Any]:
+        """Execute a pattern step that evaluates a condition."""
+        condition = step.get("condition")
+        if condition:
+            result = self._evaluate_condition(condition, context)
+            
+            return {
+                "success": True,
+                "condition_result": result,
+                "output": {"condition_met": result}
+            }
+        else:
+            return {
+                "success": False,
+                "error": "No condition specified in step"
             }
     
+    # Pattern step executors keyed by step type
+    _STEP_HANDLERS: Dict[str, Callable[..., Any]] = {
+        "tool": _execute_tool_step,
+        "condition": _execute_condition_step,
+    }
+    
     async def _load_applicable_constraints(self, operation: str) -> List[Dict[str, Any]]:
-        """Load constraints applicable to an operation."""
+        """Load constraints applicable to an operation, in constraint file order."""
         try:
-            constraints = []
-            constraint_files = list(self.force_engine.constraints_dir.glob("*.json"))
-            
-            for constraint_file in constraint_files:
-                with open(constraint_file, 'r') as f:
-                    constraints_data = json.load(f)
-                    
-                for constraint in constraints_data.get("constraints", []):
-                    if self._constraint_applies_to_operation(constraint, operation):
-                        constraints.append(constraint)
+            constraints_dir = self.force_engine.constraints_dir
+            # Rebuild when constraint files are added, removed or edited; stats are far cheaper than parsing
+            stats = tuple(
+                (str(constraint_file), stat.st_mtime_ns, stat.st_size)
+                for constraint_file in constraints_dir.glob("*.json")
+                for stat in (constraint_file.stat(),)
+            )
+            if self._constraint_index is None or stats != self._constraint_stats:
+                self._constraint_index = (self._build_constraint_index([Path(entry[0]) for entry in stats]), {})
+                self._constraint_stats = stats
             
-            return constraints
+            constraints, by_operation = self._constraint_index
+            applicable = by_operation.get(operation)
+            if applicable is None:
+                applicable = [
+                    constraint for operations, constraint in constraints
+                    if operation in operations or "all" in operations
+                ]
+                by_operation[operation] = applicable
+            return list(applicable)
             
         except Exception as e:
             logger.error(f"Failed to load constraints: {e}")
             return []
     
+    def _build_constraint_index(self, constraint_files: List[Path]) -> List[Tuple[frozenset, Dict[str, Any]]]:
+        """Parse constraint files into (operations, constraint) pairs, keeping file order."""
+        constraints: List[Tuple[frozenset, Dict[str, Any]]] = []
+        
+        for constraint_file in constraint_files:
+            with open(constraint_file, 'r') as f:
+                constraints_data = json.load(f)
+                
+            for constraint in constraints_data.get("constraints", []):
+                applies_to = constraint.get("applies_to", [])
+                if isinstance(applies_to, str):
+                    applies_to = [applies_to]
+                constraints.append((frozenset(applies_to), constraint))
+        
+        return constraints
+    
     async def _validate_constraint(self, constraint: Dict[str, Any], operation: str, context: Dict[str, Any]) -> Dict[str, Any]:
         """Validate a specific constraint."""
         try:
@@ -647,50 +794,38 @@ class LegacyAgentAdapter:
         resolved = {}
         
         for key, value in parameters.items():
-            if isinstance(value, str) and value.startswith("${") and value.endswith("}"):
-                var_name = value[2:-1]
-                resolved[key] = context.get(var_name, value)
-            else:
-                resolved[key] = value
+            var_name = _template_variable(value) if isinstance(value, str) else None
+            resolved[key] = value if var_name is None else context.get(var_name, value)
         
         return resolved
     
     def _evaluate_condition(self, condition: Dict[str, Any], context: Dict[str, Any]) -> bool:
         """Evaluate a condition against context."""
-        try:
-            condition_type = condition.get("type")
-            
-            if condition_type == "equals":
-                field = condition.get("field")
-                value = condition.get("value")
-                if field:
-                    return context.get(field) == value
-                return False
-            
-            elif condition_type == "exists":
-                field = condition.get("field")
-                if field:
-                    return field in context
-                return False
-            
-            elif condition_type == "greater_than":
-                field = condition.get("field")
-                value = condition.get("value")
-                if field and isinstance(value, (int, float)):
-                    field_value = context.get(field, 0)
-                    if isinstance(field_value, (int, float)):
-                        return field_value > value
-                return False
-            
-            return False
-            
-        except Exception:
+        if not isinstance(condition, dict):
             return False
+        
+        # Keyed on contents, so a definition edited in place is compiled again
+        key = repr((condition.get("type"), condition.get("field"), condition.get("value")))
+        evaluator = self._condition_evaluators.get(key)
+        if evaluator is None:
+            if len(self._condition_evaluators) >= CONDITION_CACHE_LIMIT:
+                self._condition_evaluators.clear()
+            # Compile from a copy so later edits to the definition cannot leak into the cached closure
+            evaluator = _compile_condition(copy.deepcopy(condition))
+            self._condition_evaluators[key] = evaluator
+        
+        return evaluator(context)
     
-    def _constraint_applies_to_operation(self, constraint: Dict[str, Any], operation: str) -> bool:
-        """Check if a constraint applies to an operation."""
-        applicable_operations = constraint.get("applies_to", [])
-        return operation in applicable_operations or "all" in applicable_operations
+    def _record_execution(self, record: Dict[str, Any]) -> None:
+        """Append an execution record and update the running duration metrics."""
+        self._execution_history.append(record)
+        
+        duration = record.get("duration", 0)
+        self._duration_total += duration
+        if duration < self._duration_min:
+            self._duration_min = duration
+        if duration > self._duration_max:
+            self._duration_max = duration
     
     def _calculate_success_rate(self) -> float:
         """Calculate success rate from execution history."""
@@ -719,170 +854,173 @@ class LegacyAgentAdapter:
         if not self._execution_history:
             return {}
         
-        durations = [record.get("duration", 0) for record in self._execution_history]
+        total_executions = len(self._execution_history)
         
         return {
-            "average_duration": sum(durations) / len(durations),
-            "min_duration": min(durations),
-            "max_duration": max(durations),
-            "total_executions": len(self._execution_history)
+            "average_duration": self._duration_total / total_executions,
+            "min_duration": self._duration_min,
+            "max_duration": self._duration_max,
+            "total_executions": total_executions
         }
 
 
 class VCMAForceAdapter(LegacyAgentAdapter):
     """Force adapter for Version Control Master Agent."""
     
-    def _initialize_mappings(self):
-        """Initialize VCMA-specific mappings."""
-        super()._initialize_mappings()
-        
-        # VCMA-specific capabilities
-        self._capability_mapping.update({
-            "analyze_commits": "analyze_repository_commits",
-            "repo_status": "get_repository_status",
-            "refresh_repo": "refresh_repository_state",
-            "manage_branches": "manage_git_branches",
-            "merge_analysis": "analyze_merge_conflicts"
-        })
-        
-        # VCMA-specific tool mappings
-        self._tool_mapping.update({
-            "analyze_commits": "git-commit-analysis",
-            "repo_status": "git-status", 
-            "refresh_repo": "git-refresh",
-            "branch_management": "git-branch-ops",
-            "merge_analysis": "git-merge-analysis"
-        })
-        
-        # VCMA-specific pattern mappings
-        self._pattern_mapping.update({
-            "analyze": "git-analysis-workflow",
-            "commit_workflow": "commit-validation-workflow",
-            "branch_workflow": "branch-management-workflow"
-        })
+    # VCMA-specific capabilities
+    _CAPABILITY_EXTRA = {
+        "analyze_commits": "analyze_repository_commits",
+        "repo_status": "get_repository_status",
+        "refresh_repo": "refresh_repository_state",
+        "manage_branches": "manage_git_branches",
+        "merge_analysis": "analyze_merge_conflicts"
+    }
+
+    # VCMA-specific tool mappings
+    _TOOL_EXTRA = {
+        "analyze_commits": "git-commit-analysis",
+        "repo_status": "git-status", 
+        "refresh_repo": "git-refresh",
+        "branch_management": "git-branch-ops",
+        "merge_analysis": "git-merge-analysis"
+    }
+
+    # VCMA-specific pattern mappings
+    _PATTERN_EXTRA = {
+        "analyze": "git-analysis-workflow",
+        "commit_workflow": "commit-validation-workflow",
+        "branch_workflow": "branch-management-workflow"
+    }
 
 
 class VCLAForceAdapter(LegacyAgentAdapter):
     """Force adapter for Version Control Listener Agent."""
     
-    def _initialize_mappings(self):
-        """Initialize VCLA-specific mappings."""
-        super()._initialize_mappings()
-        
-        # VCLA-specific capabilities
-        self._capability_mapping.update({
-            "start_monitoring": "start_repository_monitoring",
-            "stop_monitoring": "stop_repository_monitoring",
-            "get_changes": "get_repository_changes",
-            "monitor_status": "get_monitoring_status"
-        })
-        
-        # VCLA-specific tool mappings
-        self._tool_mapping.update({
-            "start_monitoring": "git-monitor-start",
-            "stop_monitoring": "git-monitor-stop", 
-            "get_changes": "git-changes",
-            "monitor_status": "git-monitor-status"
-        })
-        
-        # VCLA-specific pattern mappings
-        self._pattern_mapping.update({
-            "monitor": "repository-monitoring-workflow",
-            "change_detection": "change-detection-workflow"
-        })
+    # VCLA-specific capabilities
+    _CAPABILITY_EXTRA = {
+        "start_monitoring": "start_repository_monitoring",
+        "stop_monitoring": "stop_repository_monitoring",
+        "get_changes": "get_repository_changes",
+        "monitor_status": "get_monitoring_status"
+    }
+
+    # VCLA-specific tool mappings
+    _TOOL_EXTRA = {
+        "start_monitoring": "git-monitor-start",
+        "stop_monitoring": "git-monitor-stop", 
+        "get_changes": "git-changes",
+        "monitor_status": "git-monitor-status"
+    }
+
+    # VCLA-specific pattern mappings
+    _PATTERN_EXTRA = {
+        "monitor": "repository-monitoring-workflow",
+        "change_detection": "change-detection-workflow"
+    }
 
 
 class CDIAForceAdapter(LegacyAgentAdapter):
     """Force adapter for Code Documentation Inspector Agent."""
     
-    def _initialize_mappings(self):
-        """Initialize CDIA-specific mappings."""
-        super()._initialize_mappings()
-        
-        # CDIA-specific capabilities
-        self._capability_mapping.update({
-            "analyze_code_docs": "analyze_code_documentation",
-            "extract_docstrings": "extract_code_docstrings",
-            "validate_docs": "validate_documentation_standards",
-            "generate_docs": "generate_missing_documentation"
-        })
-        
-        # CDIA-specific tool mappings  
-        self._tool_mapping.update({
-            "analyze_code_docs": "docs-code-analysis",
-            "extract_docstrings": "docs-extraction",
-            "validate_docs": "docs-validation",
-            "generate_docs": "docs-generation"
-        })
-        
-        # CDIA-specific pattern mappings
-        self._pattern_mapping.update({
-            "analyze": "documentation-analysis-workflow",
-            "inspect": "code-documentation-inspection",
-            "validate": "documentation-validation-workflow"
-        })
+    # CDIA-specific capabilities
+    _CAPABILITY_EXTRA = {
+        "analyze_code_docs": "analyze_code_documentation",
+        "extract_docstrings": "extract_code_docstrings",
+        "validate_docs": "validate_documentation_standards",
+        "generate_docs": "generate_missing_documentation"
+    }
+
+    # CDIA-specific tool mappings  
+    _TOOL_EXTRA = {
+        "analyze_code_docs": "docs-code-analysis",
+        "extract_docstrings": "docs-extraction",
+        "validate_docs": "docs-validation",
+        "generate_docs": "docs-generation"
+    }
+
+    # CDIA-specific pattern mappings
+    _PATTERN_EXTRA = {
+        "analyze": "documentation-analysis-workflow",
+        "inspect": "code-documentation-inspection",
+        "validate": "documentation-validation-workflow"
+    }
 
 
 class RDIAForceAdapter(LegacyAgentAdapter):
     """Force adapter for README Documentation Inspector Agent."""
     
-    def _initialize_mappings(self):
-        """Initialize RDIA-specific mappings."""
-        super()._initialize_mappings()
-        
-        # RDIA-specific capabilities
-        self._capability_mapping.update({
-            "analyze_readme": "analyze_readme_documentation",
-            "validate_structure": "validate_readme_structure",
-            "check_completeness": "check_documentation_completeness",
-            "suggest_improvements": "suggest_readme_improvements"
-        })
-        
-        # RDIA-specific tool mappings
-        self._tool_mapping.update({
-            "analyze_readme": "readme-analysis",
-            "validate_structure": "readme-validation", 
-            "check_completeness": "docs-completeness-check",
-            "suggest_improvements": "docs-improvement-suggestions"
-        })
-        
-        # RDIA-specific pattern mappings
-        self._pattern_mapping.update({
-            "analyze": "readme-analysis-workflow",
-            "inspect": "readme-inspection-workflow",
-            "validate": "readme-validation-workflow"
-        })
+    # RDIA-specific capabilities
+    _CAPABILITY_EXTRA = {
+        "analyze_readme": "analyze_readme_documentation",
+        "validate_structure": "validate_readme_structure",
+        "check_completeness": "check_documentation_completeness",
+        "suggest_improvements": "suggest_readme_improvements"
+    }
+
+    # RDIA-specific tool mappings
+    _TOOL_EXTRA = {
+        "analyze_readme": "readme-analysis",
+        "validate_structure": "readme-validation", 
+        "check_completeness": "docs-completeness-check",
+        "suggest_improvements": "docs-improvement-suggestions"
+    }
+
+    # RDIA-specific pattern mappings
+    _PATTERN_EXTRA = {
+        "analyze": "readme-analysis-workflow",
+        "inspect": "readme-inspection-workflow",
+        "validate": "readme-validation-workflow"
+    }
 
 
 class SAAForceAdapter(LegacyAgentAdapter):
     """Force adapter for Static Analysis Agent."""
     
-    def _initialize_mappings(self):
-        """Initialize SAA-specific mappings."""
-        super()._initialize_mappings()
-        
-        # SAA-specific capabilities
-        self._capability_mapping.update({
-            "analyze_code": "perform_static_analysis",
-            "check_quality": "check_code_quality",
-            "detect_issues": "detect_code_issues",
-            "security_scan": "perform_security_scan"
-        })
-        
-        # SAA-specific tool mappings
-        self._tool_mapping.update({
-            "analyze_code": "static-analysis",
-            "check_quality": "code-quality-check",
-            "detect_issues": "issue-detection", 
-            "security_scan": "security-analysis"
-        })
-        
-        # SAA-specific pattern mappings
-        self._pattern_mapping.update({
-            "analyze": "static-analysis-workflow",
-            "quality_check": "code-quality-workflow",
-            "security_scan": "security-analysis-workflow"
-        })
+    # SAA-specific capabilities
+    _CAPABILITY_EXTRA = {
+        "analyze_code": "perform_static_analysis",
+        "check_quality": "check_code_quality",
+        "detect_issues": "detect_code_issues",
+        "security_scan": "perform_security_scan"
+    }
+
+    # SAA-specific tool mappings
+    _TOOL_EXTRA = {
+        "analyze_code": "static-analysis",
+        "check_quality": "code-quality-check",
+        "detect_issues": "issue-detection", 
+        "security_scan": "security-analysis"
+    }
+
+    # SAA-specific pattern mappings
+    _PATTERN_EXTRA = {
+        "analyze": "static-analysis-workflow",
+        "quality_check": "code-quality-workflow",
+        "security_scan": "security-analysis-workflow"
+    }
+
+
+# Adapter classes keyed by legacy agent class name
+_ADAPTER_BY_NAME: Dict[str, Type[LegacyAgentAdapter]] = {
+    "VersionControlMasterAgent": VCMAForceAdapter,
+    "VersionControlListenerAgent": VCLAForceAdapter,
+    "CodeDocumentationInspectorAgent": CDIAForceAdapter,
+    "READMEInspectorAgent": RDIAForceAdapter,
+    "StaticAnalysisAgent": SAAForceAdapter,
+}
+
+# Adapter classes resolved per agent class, filled lazily so agent modules
+# don't have to be imported here
+_ADAPTER_BY_CLASS: Dict[type, Type[LegacyAgentAdapter]] = {}
+
+
+def _resolve_adapter_class(agent_class: type) -> Type[LegacyAgentAdapter]:
+    """Find the adapter for an agent class, letting subclasses inherit their base's adapter."""
+    for klass in agent_class.__mro__:
+        adapter_class = _ADAPTER_BY_NAME.get(klass.__name__)
+        if adapter_class is not None:
+            return adapter_class
+    return LegacyAgentAdapter
 
 
 # Factory function for creating appropriate adapters
@@ -897,15 +1035,9 @@ def create_force_adapter(agent: BaseAgent, force_engine: Optional[ForceEngine] =
     Returns:
         Appropriate Force adapter instance
     """
-    agent_type = type(agent).__name__
-    
-    adapter_mapping = {
-        "VersionControlMasterAgent": VCMAForceAdapter,
-        "VersionControlListenerAgent": VCLAForceAdapter,
-        "CodeDocumentationInspectorAgent": CDIAForceAdapter,
-        "READMEInspectorAgent": RDIAForceAdapter,
-        "StaticAnalysisAgent": SAAForceAdapter,
-    }
+    agent_class = type(agent)
     
-    adapter_class = adapter_mapping.get(agent_type, LegacyAgentAdapter)
+    adapter_class = _ADAPTER_BY_CLASS.get(agent_class)
+    if adapter_class is None:
+        adapter_class = _ADAPTER_BY_CLASS.setdefault(agent_class, _resolve_adapter_class(agent_class))
     return adapter_class(agent, force_engine)
@@ -5,48 +5,205 @@ This module provides pattern loading and management functionality for the Force
 """
 
 import os
+import sys
 import json
+import marshal
 import logging
-from typing import Dict, List, Any, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Any, Optional, Tuple
+
+from force.user_cache import cache_file_for, write_cache_file
+
+# Prefer orjson's faster parser for pattern files when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Parsed pattern definitions cached in the per-user cache directory, keyed
+# by file name with the (mtime_ns, size) they were parsed at
+PATTERN_CACHE_FILE = "patterns.marshal"
+
+PatternCache = Dict[str, Tuple[int, int, Any]]
+
+# Minimum number of files to parse before a thread pool is worth its overhead
+PARALLEL_PARSE_THRESHOLD = 4
+
+def _read_pattern_cache(cache_path) -> PatternCache:
+    """Read the pattern cache, returning an empty cache if missing or corrupt"""
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = marshal.load(f)
+        return cache if isinstance(cache, dict) else {}
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+
+def _write_pattern_cache(cache_path, cache: PatternCache) -> None:
+    """Atomically write the pattern cache, ignoring unwritable locations"""
+    try:
+        write_cache_file(cache_path, marshal.dumps(cache))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write pattern cache {cache_path}: {e}")
+
+def _parse_pattern_files(patterns_dir: str, pattern_files: List[str]) -> List[Tuple[str, Any]]:
+    """Parse pattern files, returning (file name, definition or exception) pairs in order"""
+    def parse(pattern_file: str) -> Tuple[str, Any]:
+        try:
+            with open(os.path.join(patterns_dir, pattern_file), 'rb') as f:
+                return pattern_file, _loads(f.read())
+        except Exception as e:
+            return pattern_file, e
+    
+    if len(pattern_files) < PARALLEL_PARSE_THRESHOLD:
+        return [parse(pattern_file) for pattern_file in pattern_files]
+    
+    # Overlap the open/read syscalls of cold files; registration stays on the caller's thread
+    with ThreadPoolExecutor(max_workers=min(32, len(pattern_files))) as pool:
+        return list(pool.map(parse, pattern_files))
+
 class PatternRegistry:
-    """Registry for Force patterns"""
+    """
+    Registry for Force patterns, bound to a Force engine.
+    
+    Patterns are loaded when the registry is constructed. Each lookup then
+    stats the patterns directory once, so pattern files added, removed or
+    renamed on disk are picked up without a restart; files edited in place
+    are picked up by calling load_patterns().
+    """
     
-    def __init__(self, force_engine):
+    def __init__(self, force_engine, patterns_dir: Optional[str] = None):
         self.force_engine = force_engine
         self.patterns = {}
+        self.patterns_dir = patterns_dir or os.path.dirname(__file__)
+        
+        # Directory mtime at the last load, and the pattern IDs and parsed
+        # definitions per file, used to refresh when files are added or removed
+        self._dir_mtime_ns: Optional[int] = None
+        self._file_pattern_ids: Dict[str, str] = {}
+        # File whose definition currently backs each pattern ID; files may share an ID
+        self._pattern_id_owners: Dict[str, str] = {}
+        self._file_cache: PatternCache = {}
+        
+        # Snapshot list_patterns copies from, reset whenever the registry changes
+        self._pattern_list: Optional[Tuple[Dict[str, Any], ...]] = None
+        
+        # Load once up front so lookups only need the directory mtime check
+        self.load_patterns()
+        
+    def register_pattern(self, pattern_id: str, pattern_data: Dict[str, Any]) -> None:
+        """Register a pattern definition"""
+        if isinstance(pattern_id, str):
+            pattern_id = sys.intern(pattern_id)
+        if pattern_id in self.patterns:
+            logger.debug(f"Pattern {pattern_id} already registered, overriding")
+        self.patterns[pattern_id] = pattern_data
+        self._pattern_list = None
         
     def load_patterns(self):
         """Load all patterns from the patterns directory"""
-        patterns_dir = os.path.join(os.path.dirname(__file__))
-        pattern_files = [f for f in os.listdir(patterns_dir) if f.endswith('.json')]
+        patterns_dir = self.patterns_dir
+        # Stat before listing so changes made during the load trigger another refresh
+        self._dir_mtime_ns = os.stat(patterns_dir).st_mtime_ns
+        
+        cache_path = cache_file_for(patterns_dir, PATTERN_CACHE_FILE)
+        cache = self._file_cache or _read_pattern_cache(cache_path)
+        updated_cache: PatternCache = {}
+        
+        # Reuse cached definitions for unchanged files and collect the rest for parsing
+        pattern_files: List[str] = []
+        stale_stats: Dict[str, os.stat_result] = {}
+        with os.scandir(patterns_dir) as entries:
+            for entry in entries:
+                if not entry.name.endswith('.json'):
+                    continue
+                try:
+                    if not entry.is_file():
+                        continue
+                    stat = entry.stat()
+                except OSError as e:
+                    logger.warning(f"Failed to load pattern {entry.name}: {e}")
+                    continue
+                
+                pattern_file = entry.name
+                pattern_files.append(pattern_file)
+                cached = cache.get(pattern_file)
+                if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                    updated_cache[pattern_file] = cached
+                else:
+                    stale_stats[pattern_file] = stat
+        
+        for pattern_file, result in _parse_pattern_files(patterns_dir, list(stale_stats)):
+            if isinstance(result, Exception):
+                logger.warning(f"Failed to load pattern {pattern_file}: {result}")
+                continue
+            stat = stale_stats[pattern_file]
+            updated_cache[pattern_file] = (stat.st_mtime_ns, stat.st_size, result)
+        
+        # Drop patterns whose files were removed since the last load
+        for pattern_file in self._file_pattern_ids.keys() - updated_cache.keys():
+            self._release_pattern_id(pattern_file, self._file_pattern_ids.pop(pattern_file))
         
         for pattern_file in pattern_files:
+            if pattern_file not in updated_cache:
+                continue
             try:
-                pattern_path = os.path.join(patterns_dir, pattern_file)
-                with open(pattern_path, 'r') as f:
-                    pattern_data = json.load(f)
-                    pattern_id = pattern_data.get('id', pattern_file.replace('.json', ''))
-                    self.patterns[pattern_id] = pattern_data
-                    logger.debug(f"Loaded pattern: {pattern_id}")
+                pattern_data = updated_cache[pattern_file][2]
+                pattern_id = pattern_data.get('id', pattern_file.replace('.json', ''))
+                # Drop the ID this file registered before if its definition now uses another
+                old_id = self._file_pattern_ids.get(pattern_file)
+                if old_id is not None and old_id != pattern_id:
+                    self._release_pattern_id(pattern_file, old_id)
+                self.register_pattern(pattern_id, pattern_data)
+                self._file_pattern_ids[pattern_file] = pattern_id
+                self._pattern_id_owners[pattern_id] = pattern_file
+                logger.debug(f"Loaded pattern: {pattern_id}")
             except Exception as e:
                 logger.warning(f"Failed to load pattern {pattern_file}: {e}")
+        
+        if stale_stats or updated_cache.keys() != cache.keys():
+            _write_pattern_cache(cache_path, updated_cache)
+        self._file_cache = updated_cache
                 
         logger.info(f"Loaded {len(self.patterns)} patterns")
         return self.patterns
         
+    def _release_pattern_id(self, pattern_file: str, pattern_id: str) -> None:
+        """Unregister a pattern ID if the given file is the one currently backing it"""
+        if self._pattern_id_owners.get(pattern_id) != pattern_file:
+            return
+        del self._pattern_id_owners[pattern_id]
+        self.patterns.pop(pattern_id, None)
+        self._pattern_list = None
+        
+    def _ensure_fresh(self) -> None:
+        """Reload patterns if files were added, removed or renamed since the last load"""
+        # Deliberately one stat per lookup rather than a one-time load flag: a flag
+        # would hide patterns added while the process runs
+        try:
+            mtime_ns = os.stat(self.patterns_dir).st_mtime_ns
+        except OSError:
+            return
+        if mtime_ns != self._dir_mtime_ns:
+            self.load_patterns()
+        
     def get_pattern(self, pattern_id: str) -> Optional[Dict[str, Any]]:
         """Get a pattern by ID"""
+        self._ensure_fresh()
         return self.patterns.get(pattern_id)
         
     def list_patterns(self) -> List[Dict[str, Any]]:
         """List all available patterns"""
-        return list(self.patterns.values())
+        self._ensure_fresh()
+        if self._pattern_list is None:
+            self._pattern_list = tuple(self.patterns.values())
+        # A new list per call, so callers may sort or extend it without touching the snapshot
+        return list(self._pattern_list)
 
 def initialize(force_engine):
     """Initialize the patterns module"""
-    registry = PatternRegistry(force_engine)
-    registry.load_patterns()
-    return registry
+    return PatternRegistry(force_engine)
@@ -4,25 +4,220 @@ Force Component Auto-Fixer
 Automatically repairs legacy Force component files to match current schema format.
 """
 
+import os
 import json
+import errno
+import mmap
+import shutil
 import logging
+import functools
+import tempfile
 from pathlib import Path
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Iterator
 from datetime import datetime
-import re
+from concurrent.futures import ProcessPoolExecutor
+
+# Prefer orjson for reading and writing component files when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+    
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+    
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Component type names used in fix records, keyed by component directory
+_FIX_RECORD_TYPES = {
+    'tools': 'tool',
+    'patterns': 'pattern',
+    'constraints': 'constraint',
+    'governance': 'governance',
+}
+
+# os.link errors meaning the filesystem cannot hard-link, so the backup copies instead
+_LINK_UNSUPPORTED_ERRNOS = frozenset(
+    code for code in (getattr(errno, name, None) for name in ('EXDEV', 'EPERM', 'EMLINK', 'ENOTSUP', 'EOPNOTSUPP'))
+    if code is not None
+)
+
+# Tool fields from the old schema, in the order their removal is reported
+_LEGACY_TOOL_FIELDS = ('inputSchema', 'outputSchema', 'implementation', 'executor', 'entryPoint', 'timeout')
+_LEGACY_TOOL_FIELD_SET = frozenset(_LEGACY_TOOL_FIELDS)
+_LEGACY_TOOL_FIELD_MESSAGES = {field: f"Removed legacy field: {field}" for field in _LEGACY_TOOL_FIELDS}
+
+# Keys allowed in the current parameters structure
+_NEW_PARAMETER_KEYS = frozenset(('required', 'optional'))
+
+# Old-format parameter properties carried over to converted parameters
+_PARAM_EXTRA_KEYS = ('default', 'enum', 'items', 'minimum', 'maximum')
+_PARAM_EXTRA_KEY_SET = frozenset(_PARAM_EXTRA_KEYS)
+
+# Fix messages for fields that are checked in a loop, built once so every
+# record shares the same string objects
+_VALIDATION_FIELD_MESSAGES = {
+    field: f"Added missing validation.{field}"
+    for field in ('pre_conditions', 'post_conditions', 'error_handling')
+}
+
+def _default_metadata(now_iso: str) -> Dict[str, Any]:
+    return {"created": now_iso, "updated": now_iso, "version": "1.0.0"}
+
+# Default factories for missing required fields, in required-field order.
+# Each factory takes the fixer's timestamp and returns a fresh value.
+_PATTERN_DEFAULTS = {
+    'id': lambda now_iso: "Generated id",
+    'name': lambda now_iso: "Generated name",
+    'description': lambda now_iso: "Generated description",
+    'category': lambda now_iso: "Generated category",
+    'implementation': lambda now_iso: {"steps": [], "examples": []},
+    'metadata': _default_metadata,
+}
+
+_CONSTRAINT_DEFAULTS = {
+    'id': lambda now_iso: "Generated id",
+    'name': lambda now_iso: "Generated name",
+    'description': lambda now_iso: "Generated description",
+    'scope': lambda now_iso: {"applies_to": ["**/*"], "excludes": []},
+    'enforcement': lambda now_iso: {"level": "warning", "trigger": "on_change"},
+    'metadata': _default_metadata,
+}
+
+_GOVERNANCE_DEFAULTS = {
+    'id': lambda now_iso: "Generated id",
+    'timestamp': lambda now_iso: now_iso,
+    'event_type': lambda now_iso: "policy_update",
+    'data': lambda now_iso: {},
+    'metadata': _default_metadata,
+}
+
+_MISSING_FIELD_MESSAGES = {
+    field: f"Added missing required field: {field}"
+    for defaults in (_PATTERN_DEFAULTS, _CONSTRAINT_DEFAULTS, _GOVERNANCE_DEFAULTS)
+    for field in defaults
+}
+
+# Component files larger than this are parsed from a memory map instead of a copy
+MMAP_LOAD_THRESHOLD = 256 * 1024
+
+# Minimum number of component files before an opted-in run spreads fixing over worker processes
+PARALLEL_FIX_THRESHOLD = 64
+
+
+def _load_component_file(file_path: Path) -> Any:
+    """Parse a component file, reading large files through a memory map."""
+    with open(file_path, 'rb') as f:
+        if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > MMAP_LOAD_THRESHOLD:
+            try:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            except (OSError, ValueError):
+                mm = None
+            if mm is not None:
+                with mm, memoryview(mm) as view:
+                    return orjson.loads(view)
+        return _loads(f.read())
+
+def _is_snake_char(c: str) -> bool:
+    """Check whether a character may appear in a snake_case parameter name."""
+    return 'a' <= c <= 'z' or '0' <= c <= '9' or c == '_'
+
+
+@functools.lru_cache(maxsize=4096)
+def _snake_case(name: str) -> str:
+    """
+    Convert camelCase or other formats to snake_case (memoized, names repeat across files).
+    
+    Single pass equivalent to splitting words with the regexes
+    '(.)([A-Z][a-z]+)' and '([a-z0-9])([A-Z])', lowercasing, and replacing
+    every character outside [a-z0-9_] with an underscore.
+    """
+    out = []
+    append = out.append
+    last = len(name) - 1
+    for i, c in enumerate(name):
+        if 'A' <= c <= 'Z':
+            # Start a new word after a lowercase letter or digit, or before a capitalized word
+            if i > 0:
+                prev = name[i - 1]
+                if ('a' <= prev <= 'z' or '0' <= prev <= '9'
+                        or (i < last and 'a' <= name[i + 1] <= 'z' and prev != '\n')):
+                    append('_')
+            append(chr(ord(c) + 32))
+        elif 'a' <= c <= 'z' or '0' <= c <= '9' or c == '_':
+            append(c)
+        else:
+            for lower_c in c.lower():
+                append(lower_c if _is_snake_char(lower_c) else '_')
+    
+    snake = ''.join(out)
+    # Ensure it starts with a letter
+    if snake and not snake[0].isalpha():
+        snake = 'param_' + snake
+    # Ensure it doesn't end with underscore, and isn't empty
+    return snake.rstrip('_') or 'param'
+
+
+@functools.lru_cache(maxsize=1024)
+def _snake_case_names(names: Tuple[str, ...]) -> Tuple[str, ...]:
+    """Convert a parameter list's names at once; generated trees repeat whole lists."""
+    return tuple(_snake_case(name) for name in names)
+
+
+def _iter_json_files(root: str) -> Iterator[str]:
+    """Yield paths of all JSON files under root without following directory symlinks."""
+    stack = [root]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.name.endswith('.json') and entry.is_file():
+                    yield entry.path
+
+
+def _fix_file_job(force_dir: str, now_iso: str, file_path: str, component_type: str) -> Tuple[bool, List[Dict[str, Any]], Optional[str]]:
+    """
+    Fix one component file with a fresh fixer so it can run in a worker process.
+    
+    Returns:
+        Tuple of (changed, fixes applied, error message or None)
+    """
+    fixer = ForceComponentAutoFixer(force_dir)
+    fixer._now_iso = now_iso
+    try:
+        changed = fixer._fix_component_file(Path(file_path), component_type)
+        return changed, fixer.fixes_applied, None
+    except Exception as e:
+        return False, fixer.fixes_applied, str(e)
+
 
 class ForceComponentAutoFixer:
     """Auto-fixer for Force component files to match current schema."""
     
-    def __init__(self, force_dir: str = ".force"):
+    def __init__(self, force_dir: str = ".force", use_processes: bool = False):
         self.force_dir = Path(force_dir)
         self.logger = logging.getLogger("ForceAutoFixer")
         
+        # Worker processes are opt-in; forking from a server with a running event loop and threads is unsafe
+        self.use_processes = use_processes
+        
         # Track fixes applied
         self.fixes_applied = []
         self.files_modified = []
         
-        # Common fixes patterns
+        # Timestamp stamped into generated metadata, shared by all fixes in a run
+        self._now_iso = datetime.now().isoformat() + "Z"
+        
+        # Common fixes patterns, each returning the fixed data and the fixes applied
         self.fix_patterns = {
             'tools': self._fix_tool_component,
             'patterns': self._fix_pattern_component,
@@ -33,6 +228,7 @@ class ForceComponentAutoFixer:
     def auto_fix_all_components(self) -> Dict[str, Any]:
         """Auto-fix all invalid components in the Force directory."""
         self.logger.info("🔧 Starting auto-fix process for Force components...")
+        self._now_iso = datetime.now().isoformat() + "Z"
         
         results = {
             'success': True,
@@ -51,28 +247,31 @@ class ForceComponentAutoFixer:
             self.logger.info(f"📁 Backup created at: {backup_dir}")
         
         try:
-            # Process each component type
-            for component_type in ['tools', 'patterns', 'constraints', 'governance']:
-                component_dir = self.force_dir / component_type
-                if not component_dir.exists():
-                    continue
-                
-                # Find all JSON files recursively
-                json_files = list(component_dir.rglob("*.json"))
-                results['total_files_processed'] += len(json_files)
-                
-                for json_file in json_files:
-                    try:
-                        fixed = self._fix_component_file(json_file, component_type)
-                        if fixed:
-                            results['files_fixed'] += 1
-                            self.files_modified.append(str(json_file.relative_to(self.force_dir)))
-                    except Exception as e:
-                        self.logger.error(f"Failed to fix {json_file.name}: {e}")
-                        results['failed_fixes'].append({
-                            'file': str(json_file.relative_to(self.force_dir)),
-                            'error': str(e)
-                        })
+            # Find all JSON files recursively for each component type
+            # One listing of the Force directory finds every component directory
+            component_dirs: Dict[str, str] = {}
+            if self.force_dir.is_dir():
+                with os.scandir(self.force_dir) as entries:
+                    component_dirs = {entry.name: entry.path for entry in entries
+                                      if entry.name in _FIX_RECORD_TYPES and entry.is_dir()}
+            jobs: List[Tuple[str, str]] = []
+            for component_type in _FIX_RECORD_TYPES:
+                if component_type in component_dirs:
+                    jobs.extend((path, component_type) for path in _iter_json_files(component_dirs[component_type]))
+            results['total_files_processed'] = len(jobs)
+            
+            for (file_path, _), (changed, fixes, error) in zip(jobs, self._run_fix_jobs(jobs)):
+                self.fixes_applied.extend(fixes)
+                relative_path = str(Path(file_path).relative_to(self.force_dir))
+                if error is not None:
+                    self.logger.error(f"Failed to fix {Path(file_path).name}: {error}")
+                    results['failed_fixes'].append({
+                        'file': relative_path,
+                        'error': error
+                    })
+                elif changed:
+                    results['files_fixed'] += 1
+                    self.files_modified.append(relative_path)
             
             results['fixes_applied'] = self.fixes_applied
             results['files_modified'] = self.files_modified
@@ -86,46 +285,116 @@ class ForceComponentAutoFixer:
         
         return results
     
+    def _run_fix_jobs(self, jobs: List[Tuple[str, str]]) -> Iterator[Tuple[bool, List[Dict[str, Any]], Optional[str]]]:
+        """
+        Fix component files lazily, in this fixer or, when opted in for large trees, in worker processes.
+        
+        Yields (changed, fixes recorded by a worker, error message or None) per job; fixes made
+        in this process are recorded on self directly.
+        """
+        force_dir = str(self.force_dir)
+        if self.use_processes and len(jobs) >= PARALLEL_FIX_THRESHOLD:
+            try:
+                executor = ProcessPoolExecutor()
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning(f"Worker processes unavailable, fixing files serially: {e}")
+            else:
+                with executor:
+                    yield from executor.map(
+                        _fix_file_job,
+                        [force_dir] * len(jobs),
+                        [self._now_iso] * len(jobs),
+                        [file_path for file_path, _ in jobs],
+                        [component_type for _, component_type in jobs],
+                        chunksize=32
+                    )
+                return
+        
+        for file_path, component_type in jobs:
+            try:
+                changed, error = self._fix_component_file(Path(file_path), component_type), None
+            except Exception as e:
+                changed, error = False, str(e)
+            yield changed, [], error
+    
     def _create_backup(self) -> Optional[Path]:
-        """Create backup of the Force directory before making changes."""
+        """
+        Create backup of the Force directory before making changes.
+        
+        Component files are hard-linked where the filesystem allows it. This is
+        safe because fixed files are written to a new file and renamed into
+        place; everything else (e.g. learning data rewritten in place) is copied.
+        """
+        backup_dir = None
         try:
-            import shutil
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            backup_dir = self.force_dir.parent / f".force_backup_{timestamp}"
-            shutil.copytree(self.force_dir, backup_dir)
+            # A unique directory per run, so runs within the same second never share a backup
+            backup_dir = Path(tempfile.mkdtemp(prefix=f".force_backup_{timestamp}_", dir=self.force_dir.parent))
+            shutil.copytree(self.force_dir, backup_dir, copy_function=self._backup_copy_function(), dirs_exist_ok=True)
             return backup_dir
         except Exception as e:
             self.logger.warning(f"Failed to create backup: {e}")
+            if backup_dir is not None:
+                shutil.rmtree(backup_dir, ignore_errors=True)
             return None
     
+    def _backup_copy_function(self):
+        """Return a copytree copy function that links component files and copies the rest."""
+        component_dirs = [str(self.force_dir / name) + os.sep for name in _FIX_RECORD_TYPES]
+        
+        def copy_file(src: str, dst: str) -> str:
+            if src.startswith(tuple(component_dirs)):
+                try:
+                    os.link(src, dst)
+                    return dst
+                except OSError as e:
+                    # Hard links unsupported here (cross-device or filesystem limits)
+                    if e.errno not in _LINK_UNSUPPORTED_ERRNOS:
+                        raise
+            return shutil.copy2(src, dst)
+        
+        return copy_file
+    
     def _fix_component_file(self, file_path: Path, component_type: str) -> bool:
         """Fix a single component file."""
+        # Resolve the fixer before touching the file; unknown types need no IO
+        fix_component = self.fix_patterns.get(component_type)
+        if fix_component is None:
+            return False
+        
         try:
             # Load the component
-            with open(file_path, 'r', encoding='utf-8') as f:
-                component_data = json.load(f)
+            component_data = _load_component_file(file_path)
             
             # Apply fixes based on component type
-            if component_type in self.fix_patterns:
-                original_data = json.dumps(component_data, sort_keys=True)
-                fixed_data = self.fix_patterns[component_type](component_data, file_path)
+            fixed_data, fixes_in_file = fix_component(component_data, file_path)
+            
+            # Only rewrite files the fixer actually changed
+            if fixes_in_file:
+                self.fixes_applied.append({
+                    'file': str(file_path.relative_to(self.force_dir)),
+                    'type': _FIX_RECORD_TYPES[component_type],
+                    'fixes': fixes_in_file
+                })
+                
+                # Save the fixed component to a new file so hard-linked backups keep the original
+                tmp_path = file_path.with_name(f".{file_path.name}.tmp")
+                with open(tmp_path, 'wb') as f:
+                    f.write(_dumps(fixed_data))
+                shutil.copymode(file_path, tmp_path)
+                os.replace(tmp_path, file_path)
                 
-                # Check if changes were made
-                if json.dumps(fixed_data, sort_keys=True) != original_data:
-                    # Save the fixed component
-                    with open(file_path, 'w', encoding='utf-8') as f:
-                        json.dump(fixed_data, f, indent=2, ensure_ascii=False)
-                    
-                    self.logger.info(f"🔧 Fixed: {file_path.name}")
-                    return True
+                if self.logger.isEnabledFor(logging.INFO):
+                    self.logger.info("🔧 Fixed: %s", file_path.name)
+                return True
             
             return False
             
         except Exception as e:
-            self.logger.error(f"Error fixing {file_path.name}: {e}")
+            self.logger.error("Error fixing %s: %s", file_path.name, e)
             raise
     
-    def _fix_tool_component(self, data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    def _fix_tool_component(self, data: Dict[str, Any], file_path: Path) -> Tuple[Dict[str, Any], List[str]]:
         """Fix tool component to match current schema."""
         fixes_in_file = []
         
@@ -137,7 +406,7 @@ class ForceComponentAutoFixer:
         # Fix old parameter format
         if 'parameters' in data and isinstance(data['parameters'], dict):
             old_params = data['parameters']
-            if any(key not in ['required', 'optional'] for key in old_params.keys()):
+            if not old_params.keys() <= _NEW_PARAMETER_KEYS:
                 # Convert old format to new format
                 data['parameters'] = self._convert_old_parameters(old_params)
                 fixes_in_file.append("Converted old parameter format to new format")
@@ -194,16 +463,16 @@ class ForceComponentAutoFixer:
                     fixes_in_file.append("Moved post_conditions to execution.validation")
                 
                 # Ensure all validation fields exist
-                for field in ['pre_conditions', 'post_conditions', 'error_handling']:
+                for field, message in _VALIDATION_FIELD_MESSAGES.items():
                     if field not in validation:
                         validation[field] = []
-                        fixes_in_file.append(f"Added missing validation.{field}")
+                        fixes_in_file.append(message)
         
         # Fix metadata section
         if 'metadata' not in data:
             data['metadata'] = {
-                "created": datetime.now().isoformat() + "Z",
-                "updated": datetime.now().isoformat() + "Z",
+                "created": self._now_iso,
+                "updated": self._now_iso,
                 "version": "1.0.0"
             }
             fixes_in_file.append("Added missing metadata structure")
@@ -211,33 +480,25 @@ class ForceComponentAutoFixer:
             metadata = data['metadata']
             # Ensure required metadata fields
             if 'created' not in metadata:
-                metadata['created'] = datetime.now().isoformat() + "Z"
+                metadata['created'] = self._now_iso
                 fixes_in_file.append("Added missing metadata.created")
             if 'updated' not in metadata:
-                metadata['updated'] = datetime.now().isoformat() + "Z"
+                metadata['updated'] = self._now_iso
                 fixes_in_file.append("Added missing metadata.updated")
             if 'version' not in metadata:
                 metadata['version'] = "1.0.0"
                 fixes_in_file.append("Added missing metadata.version")
         
         # Remove old schema fields that don't belong
-        old_fields = ['inputSchema', 'outputSchema', 'implementation', 'executor', 'entryPoint', 'timeout']
-        for field in old_fields:
-            if field in data:
-                data.pop(field)
-                fixes_in_file.append(f"Removed legacy field: {field}")
-        
-        # Record fixes
-        if fixes_in_file:
-            self.fixes_applied.append({
-                'file': str(file_path.relative_to(self.force_dir)),
-                'type': 'tool',
-                'fixes': fixes_in_file
-            })
-        
-        return data
+        if not _LEGACY_TOOL_FIELD_SET.isdisjoint(data):
+            for field, message in _LEGACY_TOOL_FIELD_MESSAGES.items():
+                if field in data:
+                    del data[field]
+                    fixes_in_file.append(message)
+        
+        return data, fixes_in_file
     
-    def _fix_pattern_component(self, data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    def _fix_pattern_component(self, data: Dict[str, Any], file_path: Path) -> Tuple[Dict[str, Any], List[str]]:
         """Fix pattern component to match current schema."""
         fixes_in_file = []
         
@@ -247,20 +508,10 @@ class ForceComponentAutoFixer:
             fixes_in_file.append("Removed $schema field")
         
         # Ensure required fields exist
-        required_fields = ['id', 'name', 'description', 'category', 'implementation', 'metadata']
-        for field in required_fields:
+        for field, make_default in _PATTERN_DEFAULTS.items():
             if field not in data:
-                if field == 'implementation':
-                    data[field] = {"steps": [], "examples": []}
-                elif field == 'metadata':
-                    data[field] = {
-                        "created": datetime.now().isoformat() + "Z",
-                        "updated": datetime.now().isoformat() + "Z",
-                        "version": "1.0.0"
-                    }
-                else:
-                    data[field] = f"Generated {field}"
-                fixes_in_file.append(f"Added missing required field: {field}")
+                data[field] = make_default(self._now_iso)
+                fixes_in_file.append(_MISSING_FIELD_MESSAGES[field])
         
         # Fix implementation structure
         if 'implementation' in data:
@@ -272,108 +523,59 @@ class ForceComponentAutoFixer:
                 impl['examples'] = []
                 fixes_in_file.append("Added missing implementation.examples")
         
-        # Record fixes
-        if fixes_in_file:
-            self.fixes_applied.append({
-                'file': str(file_path.relative_to(self.force_dir)),
-                'type': 'pattern',
-                'fixes': fixes_in_file
-            })
-        
-        return data
+        return data, fixes_in_file
     
-    def _fix_constraint_component(self, data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    def _fix_constraint_component(self, data: Dict[str, Any], file_path: Path) -> Tuple[Dict[str, Any], List[str]]:
         """Fix constraint component to match current schema."""
         fixes_in_file = []
         
         # Ensure required fields exist
-        required_fields = ['id', 'name', 'description', 'scope', 'enforcement', 'metadata']
-        for field in required_fields:
+        for field, make_default in _CONSTRAINT_DEFAULTS.items():
             if field not in data:
-                if field == 'scope':
-                    data[field] = {"applies_to": ["**/*"], "excludes": []}
-                elif field == 'enforcement':
-                    data[field] = {"level": "warning", "trigger": "on_change"}
-                elif field == 'metadata':
-                    data[field] = {
-                        "created": datetime.now().isoformat() + "Z",
-                        "updated": datetime.now().isoformat() + "Z",
-                        "version": "1.0.0"
-                    }
-                else:
-                    data[field] = f"Generated {field}"
-                fixes_in_file.append(f"Added missing required field: {field}")
-        
-        # Record fixes
-        if fixes_in_file:
-            self.fixes_applied.append({
-                'file': str(file_path.relative_to(self.force_dir)),
-                'type': 'constraint',
-                'fixes': fixes_in_file
-            })
-        
-        return data
+                data[field] = make_default(self._now_iso)
+                fixes_in_file.append(_MISSING_FIELD_MESSAGES[field])
+        
+        return data, fixes_in_file
     
-    def _fix_governance_component(self, data: Dict[str, Any], file_path: Path) -> Dict[str, Any]:
+    def _fix_governance_component(self, data: Dict[str, Any], file_path: Path) -> Tuple[Dict[str, Any], List[str]]:
         """Fix governance component to match current schema."""
         fixes_in_file = []
         
         # Ensure required fields exist
-        required_fields = ['id', 'timestamp', 'event_type', 'data', 'metadata']
-        for field in required_fields:
+        for field, make_default in _GOVERNANCE_DEFAULTS.items():
             if field not in data:
-                if field == 'timestamp':
-                    data[field] = datetime.now().isoformat() + "Z"
-                elif field == 'event_type':
-                    data[field] = "policy_update"
-                elif field == 'data':
-                    data[field] = {}
-                elif field == 'metadata':
-                    data[field] = {
-                        "created": datetime.now().isoformat() + "Z",
-                        "updated": datetime.now().isoformat() + "Z",
-                        "version": "1.0.0"
-                    }
-                else:
-                    data[field] = f"Generated {field}"
-                fixes_in_file.append(f"Added missing required field: {field}")
-        
-        # Record fixes
-        if fixes_in_file:
-            self.fixes_applied.append({
-                'file': str(file_path.relative_to(self.force_dir)),
-                'type': 'governance',
-                'fixes': fixes_in_file
-            })
-        
-        return data
+                data[field] = make_default(self._now_iso)
+                fixes_in_file.append(_MISSING_FIELD_MESSAGES[field])
+        
+        return data, fixes_in_file
     
     def _convert_old_parameters(self, old_params: Dict[str, Any]) -> Dict[str, Any]:
         """Convert old parameter format to new required/optional format."""
-        new_params = {"required": [], "optional": []}
+        required: List[Dict[str, Any]] = []
+        optional: List[Dict[str, Any]] = []
         
         for param_name, param_def in old_params.items():
             if isinstance(param_def, dict):
                 # Convert camelCase to snake_case
-                snake_case_name = self._to_snake_case(param_name)
+                snake_case_name = _snake_case(param_name)
                 
                 param_obj = {
                     "name": snake_case_name,
                     "type": param_def.get("type", "string"),
-                    "description": param_def.get("description", f"Parameter {snake_case_name}")
+                    "description": param_def["description"] if "description" in param_def else f"Parameter {snake_case_name}"
                 }
                 
-                # Copy additional properties
-                for key in ["default", "enum", "items", "minimum", "maximum"]:
-                    if key in param_def:
-                        param_obj[key] = param_def[key]
+                # Copy additional properties, in a fixed order
+                if not _PARAM_EXTRA_KEY_SET.isdisjoint(param_def):
+                    param_obj.update({key: param_def[key] for key in _PARAM_EXTRA_KEYS if key in param_def})
                 
                 # Determine if required
                 if param_def.get("required", False) or "default" not in param_def:
-                    new_params["required"].append(param_obj)
+                    required.append(param_obj)
                 else:
-                    new_params["optional"].append(param_obj)
+                    optional.append(param_obj)
         
+        new_params = {"required": required, "optional": optional}
         return new_params
     
     def _fix_parameter_names(self, params: Dict[str, Any]) -> bool:
@@ -382,33 +584,19 @@ class ForceComponentAutoFixer:
         
         for param_list_name in ['required', 'optional']:
             if param_list_name in params:
-                for param in params[param_list_name]:
-                    if isinstance(param, dict) and 'name' in param:
-                        old_name = param['name']
-                        new_name = self._to_snake_case(old_name)
-                        if old_name != new_name:
-                            param['name'] = new_name
-                            changes_made = True
+                named_params = [param for param in params[param_list_name]
+                                if isinstance(param, dict) and 'name' in param]
+                new_names = _snake_case_names(tuple(param['name'] for param in named_params))
+                for param, new_name in zip(named_params, new_names):
+                    if param['name'] != new_name:
+                        param['name'] = new_name
+                        changes_made = True
         
         return changes_made
     
     def _to_snake_case(self, name: str) -> str:
         """Convert camelCase or other formats to snake_case."""
-        # Handle camelCase
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        # Handle numbers and remaining uppercase
-        s2 = re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
-        # Remove any invalid characters and ensure it starts with a letter
-        s3 = re.sub(r'[^a-z0-9_]', '_', s2)
-        # Ensure it starts with a letter
-        if s3 and not s3[0].isalpha():
-            s3 = 'param_' + s3
-        # Ensure it doesn't end with underscore
-        s3 = s3.rstrip('_')
-        # Ensure it's not empty
-        if not s3:
-            s3 = 'param'
-        return s3
+        return _snake_case(name)
 
 
 def main():
@@ -427,6 +615,8 @@ def main():
                        help="Show what would be fixed without making changes")
     parser.add_argument("--verbose", action="store_true",
                        help="Enable verbose output")
+    parser.add_argument("--parallel", action="store_true",
+                       help=f"Fix files in worker processes when there are at least {PARALLEL_FIX_THRESHOLD}")
     
     args = parser.parse_args()
     
@@ -434,7 +624,7 @@ def main():
         logging.getLogger().setLevel(logging.DEBUG)
     
     # Create auto-fixer and run
-    fixer = ForceComponentAutoFixer(args.force_dir)
+    fixer = ForceComponentAutoFixer(args.force_dir, use_processes=args.parallel)
     
     if args.dry_run:
         print("🔍 DRY RUN MODE - No changes will be made")
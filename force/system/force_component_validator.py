@@ -5,20 +5,102 @@ Comprehensive validation system for Force components with MCP server startup int
 """
 
 import json
+import mmap
 import jsonschema
-from jsonschema import validate, ValidationError, RefResolver
+from jsonschema import ValidationError, RefResolver
+from jsonschema.exceptions import best_match
 import os
 import sys
 import logging
+import functools
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+
+# Prefer orjson for reading component files and writing reports when it is installed
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    
+    def _loads(raw: bytes) -> Any:
+        return orjson.loads(raw)
+    
+    def _dumps(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    ORJSON_AVAILABLE = False
+    
+    def _loads(raw: bytes) -> Any:
+        return json.loads(raw)
+    
+    def _dumps(data: Any) -> bytes:
+        return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+# Prefer the native jsonschema-rs validators, then fastjsonschema, when installed
+try:
+    import jsonschema_rs
+    from jsonschema_rs import ValidationError as RsValidationError
+    JSONSCHEMA_RS_AVAILABLE = True
+except ImportError:
+    JSONSCHEMA_RS_AVAILABLE = False
+    
+    class RsValidationError(Exception):
+        """Placeholder so validation error handling works without jsonschema-rs."""
+
+try:
+    import fastjsonschema
+    from fastjsonschema import JsonSchemaValueException
+    FASTJSONSCHEMA_AVAILABLE = True
+except ImportError:
+    FASTJSONSCHEMA_AVAILABLE = False
+    
+    class JsonSchemaValueException(Exception):
+        """Placeholder so validation error handling works without fastjsonschema."""
+
+def _iter_json_files(root: str) -> Iterator[str]:
+    """Yield JSON files under root, walking the tree with os.scandir."""
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith('.json') and entry.is_file():
+                    yield entry.path
+
+@functools.lru_cache(maxsize=1024)
+def _parse_timestamp(value: str) -> datetime:
+    """Parse an ISO-8601 timestamp; components written together share the same values."""
+    return datetime.fromisoformat(value.replace('Z', '+00:00'))
+
+# Schema files larger than this are parsed from a memory map instead of a copy
+MMAP_LOAD_THRESHOLD = 256 * 1024
+
+# Top-level ToolDefinition keys that semantic validation inspects
+_TOOL_SEMANTIC_KEYS = frozenset(('type', 'execution', 'metadata'))
+
+# Minimum number of files of one component type before an opted-in run spreads validation over worker processes
+PARALLEL_VALIDATION_THRESHOLD = 64
+
+# Validators built inside worker processes, keyed by Force directory
+_worker_validators: Dict[str, 'ForceValidator'] = {}
+
+def _validate_file_job(force_dir: str, json_file: str, schema_key: str) -> Dict[str, Any]:
+    """Validate one component file in a worker process, reusing that process's validator."""
+    validator = _worker_validators.get(force_dir)
+    if validator is None:
+        validator = _worker_validators[force_dir] = ForceValidator(force_dir)
+    return validator._validate_file(json_file, schema_key)
 
 class ForceValidator:
     """Comprehensive validator for Force system components."""
     
-    def __init__(self, force_dir: str = ".force"):
+    def __init__(self, force_dir: str = ".force", use_processes: bool = False):
         self.force_dir = Path(force_dir)
+        self._force_dir_prefix = str(self.force_dir) + os.sep
+        # Worker processes are opt-in; forking from a server with a running event loop and threads is unsafe
+        self.use_processes = use_processes
         # Prefer extended schema, fallback to standard schema
         extended_schema_file = self.force_dir / "schemas" / "force-extended-schema.json"
         standard_schema_file = self.force_dir / "schemas" / "force-schema.json"
@@ -64,14 +146,24 @@ class ForceValidator:
             }
         }
         
+        # Compile one validator per schema key up front
+        self._compiled = self._compile_validators()
+        self._validators = self._build_validators()
+        
     def _load_schema(self) -> Dict[str, Any]:
         """Load and validate the Force schema."""
         try:
-            with open(self.schema_file, 'r', encoding='utf-8') as f:
-                schema = json.load(f)
+            with open(self.schema_file, 'rb') as f:
+                if ORJSON_AVAILABLE and os.fstat(f.fileno()).st_size > MMAP_LOAD_THRESHOLD:
+                    # Parse large schemas straight from the page cache
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                        schema = orjson.loads(view)
+                else:
+                    schema = _loads(f.read())
             
-            # Validate schema itself
-            jsonschema.Draft7Validator.check_schema(schema)
+            # Validate schema itself with the draft it declares
+            self._validator_class = jsonschema.validators.validator_for(schema, default=jsonschema.Draft7Validator)
+            self._validator_class.check_schema(schema)
             self.logger.info("✅ Force schema loaded and validated successfully")
             return schema
             
@@ -85,13 +177,49 @@ class ForceValidator:
             self.logger.error(f"❌ Invalid schema structure: {e}")
             raise
     
-    def _load_component(self, file_path: Path) -> Optional[Dict[str, Any]]:
+    def _compile_validators(self) -> Dict[str, Callable[[Any], Any]]:
+        """Compile a native or generated validator for each component schema key."""
+        compiled = {}
+        if not (JSONSCHEMA_RS_AVAILABLE or FASTJSONSCHEMA_AVAILABLE):
+            return compiled
+        
+        definitions = self.schema.get('definitions', {})
+        for config in self.component_types.values():
+            schema_key = config['schema_key']
+            subschema = {'$ref': f'#/definitions/{schema_key}', 'definitions': definitions}
+            # Formats are not asserted, matching jsonschema's default behaviour
+            if JSONSCHEMA_RS_AVAILABLE:
+                try:
+                    compiled[schema_key] = jsonschema_rs.Draft7Validator(subschema, validate_formats=False).validate
+                    continue
+                except Exception as e:
+                    self.logger.debug(f"jsonschema-rs could not compile {schema_key}: {e}")
+            if FASTJSONSCHEMA_AVAILABLE:
+                try:
+                    # Generated in memory from the loaded schema; no generated code is read back from disk
+                    compiled[schema_key] = fastjsonschema.compile(subschema, use_default=False, use_formats=False)
+                    continue
+                except Exception as e:
+                    self.logger.debug(f"fastjsonschema could not compile {schema_key}: {e}")
+            self.logger.warning(f"Could not compile validator for {schema_key}, using jsonschema")
+        return compiled
+    
+    def _build_validators(self) -> Dict[str, Any]:
+        """Build reusable jsonschema validators for schema keys without a compiled validator."""
+        definitions = self.schema.get('definitions', {})
+        return {
+            config['schema_key']: self._validator_class(definitions[config['schema_key']], resolver=self.resolver)
+            for config in self.component_types.values()
+            if config['schema_key'] not in self._compiled and config['schema_key'] in definitions
+        }
+    
+    def _load_component(self, file_path: str) -> Optional[Dict[str, Any]]:
         """Load a component JSON file with error handling."""
         try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                return json.load(f)
+            with open(file_path, 'rb') as f:
+                return _loads(f.read())
         except Exception as e:
-            self.logger.warning(f"❌ Failed to load {file_path.name}: {e}")
+            self.logger.warning(f"❌ Failed to load {os.path.basename(file_path)}: {e}")
             return None
     
     def validate_component(self, component_data: Dict[str, Any], schema_key: str) -> Dict[str, Any]:
@@ -104,11 +232,14 @@ class ForceValidator:
         }
         
         try:
-            # Get component schema from definitions
-            component_schema = self.schema['definitions'][schema_key]
-            
-            # Validate against schema
-            validate(instance=component_data, schema=component_schema, resolver=self.resolver)
+            # Validate against schema, preferring the compiled validator
+            compiled = self._compiled.get(schema_key)
+            if compiled is not None:
+                compiled(component_data)
+            else:
+                error = best_match(self._validators[schema_key].iter_errors(component_data))
+                if error is not None:
+                    raise error
             
             # Additional semantic validation
             semantic_errors = self._validate_semantics(component_data, schema_key)
@@ -118,7 +249,7 @@ class ForceValidator:
             else:
                 result['valid'] = True
                 
-        except ValidationError as e:
+        except (ValidationError, JsonSchemaValueException, RsValidationError) as e:
             result['errors'] = [str(e.message)]
             result['detailed_errors'] = [self._format_validation_error(e)]
         except Exception as e:
@@ -127,73 +258,106 @@ class ForceValidator:
         
         return result
     
-    def _format_validation_error(self, error: ValidationError) -> str:
+    def _format_validation_error(self, error: Exception) -> str:
         """Format validation error with path information."""
-        path = " -> ".join(str(p) for p in error.absolute_path) if error.absolute_path else "root"
+        if isinstance(error, JsonSchemaValueException):
+            # fastjsonschema paths start at the 'data' root
+            error_path = error.path[1:]
+        elif isinstance(error, RsValidationError):
+            error_path = error.instance_path
+        else:
+            error_path = error.absolute_path
+        path = " -> ".join(str(p) for p in error_path) if error_path else "root"
         return f"Path '{path}': {error.message}"
     
     def _validate_semantics(self, component_data: Dict[str, Any], component_type: str) -> List[str]:
         """Perform semantic validation beyond schema requirements."""
+        handler = self._SEMANTIC_HANDLERS.get(component_type)
+        if handler is None:
+            return []
+        return handler(self, component_data)
+    
+    def _validate_tool_semantics(self, component_data: Dict[str, Any]) -> List[str]:
+        """Semantic checks for ToolDefinition components."""
         errors = []
+        if _TOOL_SEMANTIC_KEYS.isdisjoint(component_data):
+            return errors
+        
+        # Check for invalid 'type' property (not in schema)
+        if 'type' in component_data:
+            errors.append("Property 'type' is not allowed in ToolDefinition")
         
-        if component_type == 'ToolDefinition':
-            # Check for invalid 'type' property (not in schema)
-            if 'type' in component_data:
-                errors.append("Property 'type' is not allowed in ToolDefinition")
+        # Validate execution strategy consistency
+        if 'execution' in component_data:
+            execution = component_data['execution']
+            strategy = execution.get('strategy')
+            commands = execution.get('commands', [])
             
-            # Validate execution strategy consistency
-            if 'execution' in component_data:
-                execution = component_data['execution']
-                strategy = execution.get('strategy')
-                commands = execution.get('commands', [])
-                
-                # Allow single commands for sequential strategy (less strict validation)
-                if strategy == 'parallel' and len(commands) <= 1:
-                    errors.append("Parallel strategy should have multiple commands")
-                
-                # Validate command dependencies for conditional/iterative strategies
-                if strategy in ['conditional', 'iterative']:
-                    for cmd in commands:
-                        if 'condition' not in cmd and strategy == 'conditional':
-                            errors.append(f"Conditional strategy requires 'condition' in command: {cmd.get('action', 'unknown')}")
+            # Allow single commands for sequential strategy (less strict validation)
+            if strategy == 'parallel' and len(commands) <= 1:
+                errors.append("Parallel strategy should have multiple commands")
             
-            # Validate metadata consistency
-            if 'metadata' in component_data:
-                metadata = component_data['metadata']
-                created = metadata.get('created')
-                updated = metadata.get('updated')
-                
-                if created and updated:
-                    try:
-                        created_dt = datetime.fromisoformat(created.replace('Z', '+00:00'))
-                        updated_dt = datetime.fromisoformat(updated.replace('Z', '+00:00'))
-                        if updated_dt < created_dt:
-                            errors.append("Updated timestamp cannot be before created timestamp")
-                    except ValueError as e:
-                        errors.append(f"Invalid timestamp format: {e}")
-        
-        elif component_type == 'Pattern':
-            # Validate pattern-specific semantics
-            if 'implementation' in component_data:
-                impl = component_data['implementation']
-                if 'steps' in impl and 'examples' in impl:
-                    if len(impl['steps']) == 0:
-                        errors.append("Pattern implementation must have at least one step")
-                    if len(impl['examples']) == 0:
-                        errors.append("Pattern implementation should include examples")
-        
-        elif component_type == 'Constraint':
-            # Validate constraint-specific semantics
-            if 'enforcement' in component_data:
-                enforcement = component_data['enforcement']
-                level = enforcement.get('level')
-                if level not in ['error', 'warning', 'info']:
-                    errors.append(f"Invalid enforcement level: {level}")
+            # Validate command dependencies for conditional/iterative strategies
+            if strategy in ['conditional', 'iterative']:
+                for cmd in commands:
+                    if 'condition' not in cmd and strategy == 'conditional':
+                        errors.append(f"Conditional strategy requires 'condition' in command: {cmd.get('action', 'unknown')}")
+        
+        # Validate metadata consistency
+        if 'metadata' in component_data:
+            metadata = component_data['metadata']
+            created = metadata.get('created')
+            updated = metadata.get('updated')
+            
+            if created and updated:
+                try:
+                    if _parse_timestamp(updated) < _parse_timestamp(created):
+                        errors.append("Updated timestamp cannot be before created timestamp")
+                except ValueError as e:
+                    errors.append(f"Invalid timestamp format: {e}")
+        
+        return errors
+    
+    def _validate_pattern_semantics(self, component_data: Dict[str, Any]) -> List[str]:
+        """Semantic checks for Pattern components."""
+        errors = []
+        
+        if 'implementation' in component_data:
+            impl = component_data['implementation']
+            if 'steps' in impl and 'examples' in impl:
+                if len(impl['steps']) == 0:
+                    errors.append("Pattern implementation must have at least one step")
+                if len(impl['examples']) == 0:
+                    errors.append("Pattern implementation should include examples")
         
         return errors
     
-    def validate_component_type(self, component_type: str) -> Dict[str, Any]:
-        """Validate all components of a specific type, including subdirectories."""
+    def _validate_constraint_semantics(self, component_data: Dict[str, Any]) -> List[str]:
+        """Semantic checks for Constraint components."""
+        errors = []
+        
+        if 'enforcement' in component_data:
+            enforcement = component_data['enforcement']
+            level = enforcement.get('level')
+            if level not in ['error', 'warning', 'info']:
+                errors.append(f"Invalid enforcement level: {level}")
+        
+        return errors
+    
+    # Semantic validators keyed by schema key
+    _SEMANTIC_HANDLERS: Dict[str, Callable[..., List[str]]] = {
+        'ToolDefinition': _validate_tool_semantics,
+        'Pattern': _validate_pattern_semantics,
+        'Constraint': _validate_constraint_semantics,
+    }
+    
+    def validate_component_type(self, component_type: str, json_files: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Validate all components of a specific type, including subdirectories.
+        
+        Args:
+            component_type: Key into component_types
+            json_files: Files already found for this type, or None to walk its directory
+        """
         config = self.component_types[component_type]
         directory = config['dir']
         schema_key = config['schema_key']
@@ -210,64 +374,100 @@ class ForceValidator:
             self.logger.info(f"Skipping disabled component type: {component_type}")
             return results
             
-        if not directory.exists():
-            self.logger.warning(f"Directory does not exist: {directory}")
-            return results
-        
-        # Recursively find all JSON files in directory and subdirectories
-        json_files = list(directory.rglob("*.json"))
+        if json_files is None:
+            if not directory.is_dir():
+                self.logger.warning(f"Directory does not exist: {directory}")
+                return results
+            
+            # Recursively find all JSON files in directory and subdirectories
+            json_files = list(_iter_json_files(str(directory)))
         results['total'] = len(json_files)
         
         self.logger.info(f"Validating {len(json_files)} {component_type} files (including subdirectories)...")
         
-        for json_file in json_files:
-            component_data = self._load_component(json_file)
-            
-            if component_data is None:
-                # File loading failed
-                invalid_result = {
-                    'file': json_file.name,
-                    'path': str(json_file.relative_to(self.force_dir)),
-                    'valid': False,
-                    'error': 'Failed to load JSON file',
-                    'detailed_errors': ['Failed to load JSON file']
-                }
-                results['invalid'].append(invalid_result)
-                self.logger.warning(f"❌ Invalid {component_type}: {json_file.name} - Failed to load JSON file")
-                continue
-            
-            # Validate component
-            validation_result = self.validate_component(component_data, schema_key)
-            
-            component_result = {
-                'file': json_file.name,
-                'path': str(json_file.relative_to(self.force_dir)),
-                'valid': validation_result['valid'],
-                'error': None,
-                'detailed_errors': validation_result['detailed_errors']
-            }
-            
-            # Extract component metadata
-            if 'id' in component_data:
-                component_result['tool_id'] = component_data['id']
-            if 'name' in component_data:
-                component_result['tool_name'] = component_data['name']
-            
-            if validation_result['valid']:
+        for component_result in self._run_validation_jobs(json_files, schema_key):
+            if component_result['valid']:
                 results['valid'].append(component_result)
             else:
-                # Format error message
-                error_count = len(validation_result['errors'])
-                if error_count == 1 and 'Semantic validation failed' not in validation_result['errors'][0]:
-                    component_result['error'] = f"Validation failed with {error_count} errors"
-                else:
-                    component_result['error'] = "Semantic validation failed"
-                
                 results['invalid'].append(component_result)
-                self.logger.warning(f"❌ Invalid {component_type}: {json_file.name} - {component_result['error']}")
+                self.logger.warning(f"❌ Invalid {component_type}: {component_result['file']} - {component_result['error']}")
         
         return results
     
+    def _run_validation_jobs(self, json_files: List[str], schema_key: str) -> List[Dict[str, Any]]:
+        """Validate component files, using worker processes for large directories when opted in."""
+        if self.use_processes and len(json_files) >= PARALLEL_VALIDATION_THRESHOLD:
+            try:
+                executor = ProcessPoolExecutor()
+            except (OSError, NotImplementedError) as e:
+                self.logger.warning(f"Worker processes unavailable, validating serially: {e}")
+            else:
+                with executor:
+                    return list(executor.map(
+                        _validate_file_job,
+                        [str(self.force_dir)] * len(json_files),
+                        json_files,
+                        [schema_key] * len(json_files),
+                        chunksize=16
+                    ))
+        
+        return [self._validate_file(json_file, schema_key) for json_file in json_files]
+    
+    def _validate_file(self, json_file: str, schema_key: str) -> Dict[str, Any]:
+        """Load and validate one component file, returning its result entry."""
+        component_data = self._load_component(json_file)
+        file_name = os.path.basename(json_file)
+        relative_path = str(json_file).removeprefix(self._force_dir_prefix)
+        
+        if component_data is None:
+            # File loading failed
+            return {
+                'file': file_name,
+                'path': relative_path,
+                'valid': False,
+                'error': 'Failed to load JSON file',
+                'detailed_errors': ['Failed to load JSON file']
+            }
+        
+        # Validate component
+        validation_result = self.validate_component(component_data, schema_key)
+        
+        component_result = {
+            'file': file_name,
+            'path': relative_path,
+            'valid': validation_result['valid'],
+            'error': None,
+            'detailed_errors': validation_result['detailed_errors']
+        }
+        
+        # Extract component metadata
+        if 'id' in component_data:
+            component_result['tool_id'] = component_data['id']
+        if 'name' in component_data:
+            component_result['tool_name'] = component_data['name']
+        
+        if not validation_result['valid']:
+            # Format error message
+            error_count = len(validation_result['errors'])
+            if error_count == 1 and 'Semantic validation failed' not in validation_result['errors'][0]:
+                component_result['error'] = f"Validation failed with {error_count} errors"
+            else:
+                component_result['error'] = "Semantic validation failed"
+        
+        return component_result
+    
+    def _enumerate_all(self) -> Dict[str, List[str]]:
+        """Find the JSON files of every enabled component type with one listing of the Force directory."""
+        type_by_dir = {config['dir'].name: component_type
+                       for component_type, config in self.component_types.items()
+                       if config['enabled'] and config['dir'].parent == self.force_dir}
+        if not self.force_dir.is_dir():
+            return {}
+        with os.scandir(self.force_dir) as entries:
+            type_dirs = {type_by_dir[entry.name]: entry.path for entry in entries
+                         if entry.name in type_by_dir and entry.is_dir()}
+        return {component_type: list(_iter_json_files(path)) for component_type, path in type_dirs.items()}
+    
     def validate_all(self) -> Dict[str, Any]:
         """Validate all Force components."""
         self.logger.info("🔍 Starting comprehensive Force component validation...")
@@ -285,8 +485,9 @@ class ForceValidator:
         }
         
         # Validate each component type
+        component_files = self._enumerate_all()
         for component_type in self.component_types:
-            type_results = self.validate_component_type(component_type)
+            type_results = self.validate_component_type(component_type, component_files.get(component_type))
             results[component_type] = type_results
             
             # Update summary
@@ -360,8 +561,8 @@ class ForceValidator:
         """Save detailed validation results to JSON file."""
         output_path = self.force_dir / "validation_report.json"
         
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, ensure_ascii=False)
+        with open(output_path, 'wb') as f:
+            f.write(_dumps(results))
         
         return str(output_path.relative_to(self.force_dir))
     
@@ -376,14 +577,13 @@ class ForceValidator:
         # For demonstration purposes, we'll be less strict about individual tool failures
         # In production, you might want to enforce critical tools more strictly
         
-        # Check if the majority of core components are failing (> 80% failure rate)
-        for component_type in ['tools']:
-            total = results[component_type]['total']
-            valid = results[component_type]['valid']
-            if total > 0:
-                failure_rate = (total - len(valid)) / total
-                if failure_rate > 0.9:  # More than 90% failure
-                    blocking_issues.append(f"Critical system failure: {failure_rate*100:.1f}% of {component_type} are invalid")
+        # Check if the majority of core tools are failing
+        tools = results['tools']
+        total = tools['total']
+        if total > 0:
+            failure_rate = (total - len(tools['valid'])) / total
+            if failure_rate > 0.9:  # More than 90% failure
+                blocking_issues.append(f"Critical system failure: {failure_rate*100:.1f}% of tools are invalid")
         
         return blocking_issues
 
@@ -407,6 +607,8 @@ def main():
                        help="Enable verbose output")
     parser.add_argument("--save-report", action="store_true",
                        help="Save detailed JSON report")
+    parser.add_argument("--parallel", action="store_true",
+                       help=f"Validate in worker processes when a component type has at least {PARALLEL_VALIDATION_THRESHOLD} files")
     
     args = parser.parse_args()
     
@@ -418,7 +620,7 @@ def main():
         print("=" * 60)
     
     # Create validator and run validation
-    validator = ForceValidator(args.force_dir)
+    validator = ForceValidator(args.force_dir, use_processes=args.parallel)
     results = validator.validate_all()
     
     # Generate and display report
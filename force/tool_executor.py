@@ -9,13 +9,283 @@ import asyncio
 import subprocess
 import logging
 import os
-import json
-from typing import Dict, Any, Optional, List
+import re
+import shlex
+import time
+from collections import Counter
+from typing import Dict, Any, Optional, List, Iterator, Callable, Tuple, Set
 from pathlib import Path
 from datetime import datetime, timezone
 
+try:
+    from pyflakes.api import check as pyflakes_check
+    PYFLAKES_AVAILABLE = True
+except ImportError:
+    PYFLAKES_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Exit status of the chained commit command when staging fails, distinct from git's own codes
+STAGE_FAILED_EXIT_CODE = 90
+
+# Bytes of stdout kept by the fast path for short git queries (hashes, exit-code checks)
+SMALL_OUTPUT_LIMIT = 4096
+
+# Linter command lines; flake8 parallelises across cores itself
+LINTER_COMMANDS = {
+    "flake8": ["flake8", "--jobs=auto", "."],
+    "mypy": ["mypy", "--show-error-codes", "."],
+}
+
+# Structured forms of linter output lines
+_FLAKE8_LINE = re.compile(r"^(?P<file>.+?):(?P<line>\d+):(?P<column>\d+): (?P<code>[A-Z]+\d+) (?P<text>.*)$")
+_MYPY_LINE = re.compile(r"^(?P<file>.+?):(?P<line>\d+):(?:(?P<column>\d+):)? error: (?P<text>.*?)(?:  \[(?P<code>[\w-]+)\])?$")
+
+def _parse_linter_line(linter: str, line: str) -> Optional[Dict[str, Any]]:
+    """Turn one line of linter output into an issue, or None if it is not one."""
+    if linter == "flake8":
+        match = _FLAKE8_LINE.match(line)
+        if match is None and ':' not in line:
+            return None
+    else:
+        match = _MYPY_LINE.match(line)
+        if match is None and not (':' in line and 'error:' in line):
+            return None
+    
+    issue = {"linter": linter, "message": line}
+    if match is not None:
+        issue["file"] = match["file"]
+        issue["line"] = int(match["line"])
+        if match["column"] is not None:
+            issue["column"] = int(match["column"])
+        if match["code"] is not None:
+            issue["code"] = match["code"]
+    return issue
+
+# flake8's codes for pyflakes messages, reported with the in-process results
+_PYFLAKES_CODES = {
+    "UnusedImport": "F401",
+    "ImportShadowedByLoopVar": "F402",
+    "ImportStarUsed": "F403",
+    "LateFutureImport": "F404",
+    "ImportStarUsage": "F405",
+    "ImportStarNotPermitted": "F406",
+    "FutureFeatureNotDefined": "F407",
+    "PercentFormatInvalidFormat": "F501",
+    "PercentFormatExpectedMapping": "F502",
+    "PercentFormatExpectedSequence": "F503",
+    "PercentFormatExtraNamedArguments": "F504",
+    "PercentFormatMissingArgument": "F505",
+    "PercentFormatMixedPositionalAndNamed": "F506",
+    "PercentFormatPositionalCountMismatch": "F507",
+    "PercentFormatStarRequiresSequence": "F508",
+    "PercentFormatUnsupportedFormatCharacter": "F509",
+    "StringDotFormatInvalidFormat": "F521",
+    "StringDotFormatExtraNamedArguments": "F522",
+    "StringDotFormatExtraPositionalArguments": "F523",
+    "StringDotFormatMissingArgument": "F524",
+    "StringDotFormatMixingAutomatic": "F525",
+    "FStringMissingPlaceholders": "F541",
+    "MultiValueRepeatedKeyLiteral": "F601",
+    "MultiValueRepeatedKeyVariable": "F602",
+    "TooManyExpressionsInStarredAssignment": "F621",
+    "TwoStarredExpressions": "F622",
+    "AssertTuple": "F631",
+    "IsLiteral": "F632",
+    "InvalidPrintSyntax": "F633",
+    "IfTuple": "F634",
+    "BreakOutsideLoop": "F701",
+    "ContinueOutsideLoop": "F702",
+    "YieldOutsideFunction": "F704",
+    "ReturnOutsideFunction": "F706",
+    "DefaultExceptNotLast": "F707",
+    "DoctestSyntaxError": "F721",
+    "ForwardAnnotationSyntaxError": "F722",
+    "RedefinedWhileUnused": "F811",
+    "UndefinedName": "F821",
+    "UndefinedExport": "F822",
+    "UndefinedLocal": "F823",
+    "UnusedIndirectAssignment": "F824",
+    "DuplicateArgument": "F831",
+    "UnusedVariable": "F841",
+    "UnusedAnnotation": "F842",
+    "RaiseNotImplemented": "F901",
+}
+
+class _PyflakesCollector:
+    """pyflakes reporter that records messages as issues with their flake8 codes."""
+    
+    def __init__(self):
+        self.issues: List[Dict[str, Any]] = []
+    
+    def flake(self, message) -> None:
+        code = _PYFLAKES_CODES.get(type(message).__name__)
+        column = message.col + 1
+        text = message.message % message.message_args
+        issue = {
+            "linter": "pyflakes",
+            "message": f"{message.filename}:{message.lineno}:{column}: {code + ' ' if code else ''}{text}",
+            "file": message.filename,
+            "line": message.lineno,
+            "column": column
+        }
+        if code is not None:
+            issue["code"] = code
+        self.issues.append(issue)
+    
+    def syntaxError(self, filename: str, msg: str, lineno: int, offset: Optional[int], text: Optional[str]) -> None:
+        column = offset or 1
+        self.issues.append({
+            "linter": "pyflakes",
+            "message": f"{filename}:{lineno}:{column}: E999 SyntaxError: {msg}",
+            "file": filename,
+            "line": lineno,
+            "column": column,
+            "code": "E999"
+        })
+    
+    def unexpectedError(self, filename: str, msg: str) -> None:
+        logger.warning(f"pyflakes could not check {filename}: {msg}")
+
+# Seconds a doc glob expansion is reused; nested changes do not touch the cwd mtime
+GLOB_CACHE_TTL = 2.0
+GLOB_CACHE_LIMIT = 64
+
+# Documentation files read per worker thread during doc analysis
+DOC_ANALYSIS_BATCH_SIZE = 32
+
+# Directories skipped when scanning project sources, along with hidden ones
+EXCLUDED_SCAN_DIRS = frozenset({"node_modules", "__pycache__", "venv", "build", "dist"})
+
+def _iter_py_files(root: str) -> Iterator[str]:
+    """Yield Python source files under root, pruning hidden and generated directories."""
+    pending = [root]
+    while pending:
+        try:
+            with os.scandir(pending.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if name.startswith(".") or name in EXCLUDED_SCAN_DIRS:
+                        continue
+                    if entry.is_dir(follow_symlinks=False):
+                        pending.append(entry.path)
+                    elif name.endswith(".py") and entry.is_file(follow_symlinks=False):
+                        yield entry.path
+        except OSError:
+            # Unreadable directories are skipped, as os.walk does
+            continue
+
+def _pyflakes_check_project(root: str) -> List[Dict[str, Any]]:
+    """
+    Run pyflakes over a project in this process.
+    
+    Plain pyflakes results labelled with flake8's F codes; flake8 config and
+    # noqa comments are not applied, use the flake8 linter for those.
+    """
+    collector = _PyflakesCollector()
+    for path in sorted(_iter_py_files(root)):
+        try:
+            with open(path, 'rb') as f:
+                source = f.read()
+        except OSError as e:
+            logger.warning(f"pyflakes could not check {path}: {e}")
+            continue
+        pyflakes_check(source, path, collector)
+    return collector.issues
+
+def _scan_top_level(root: str) -> Dict[str, os.DirEntry]:
+    """List the entries directly under root by name."""
+    try:
+        with os.scandir(root) as entries:
+            return {entry.name: entry for entry in entries}
+    except OSError:
+        return {}
+
+def _top_level_exists(top_level: Dict[str, os.DirEntry], name: str) -> bool:
+    """Check a scanned entry the way os.path.exists would; a trailing slash requires a directory."""
+    entry = top_level.get(name.rstrip("/"))
+    if entry is None:
+        return False
+    if name.endswith("/"):
+        return entry.is_dir()
+    return True
+
+# Number of space-separated fields before the path in `git status --porcelain=v2` entries
+_PORCELAIN_V2_PATH_FIELD = {"1": 8, "u": 10, "?": 1}
+
+def _parse_porcelain_v2_paths(status_output: str) -> List[str]:
+    """Extract changed paths from NUL-separated `git status --porcelain=v2 --no-renames` output."""
+    paths = []
+    for entry in status_output.split("\0"):
+        path_field = _PORCELAIN_V2_PATH_FIELD.get(entry[:1])
+        if path_field is not None:
+            paths.append(entry.split(" ", path_field)[path_field])
+    return paths
+
+def _read_head_sha(repo_dir: str) -> Optional[str]:
+    """Resolve HEAD by reading .git directly; None when git itself is needed to answer."""
+    git_dir = os.path.join(repo_dir, ".git")
+    try:
+        with open(os.path.join(git_dir, "HEAD"), 'r', encoding='utf-8') as f:
+            head = f.read().strip()
+        if head.startswith("ref: "):
+            # Loose refs only; packed refs, worktrees and subdirectories go through git
+            with open(os.path.join(git_dir, head[5:]), 'r', encoding='utf-8') as f:
+                head = f.read().strip()
+    except OSError:
+        return None
+    if len(head) in (40, 64) and all(c in "0123456789abcdef" for c in head):
+        return head
+    return None
+
+def _analyze_doc_file(doc_file: str) -> List[Dict[str, Any]]:
+    """Read one documentation file and return the issues found in it."""
+    issues = []
+    try:
+        with open(doc_file, 'r', encoding='utf-8') as f:
+            content = f.read()
+    except Exception as e:
+        issues.append({
+            "file": doc_file,
+            "type": "read_error",
+            "severity": "error",
+            "message": f"Could not read file: {str(e)}"
+        })
+        return issues
+    
+    # Basic analysis
+    if len(content.strip()) == 0:
+        issues.append({
+            "file": doc_file,
+            "type": "empty_file",
+            "severity": "warning",
+            "message": "File is empty"
+        })
+    
+    # Check for basic structure (headers, etc.)
+    if not content.startswith('#'):
+        issues.append({
+            "file": doc_file,
+            "type": "missing_header",
+            "severity": "info",
+            "message": "File does not start with a header"
+        })
+    
+    # TODO: Implement link checking and code example validation
+    
+    return issues
+
+def _analyze_doc_files(doc_files: List[str]) -> Tuple[List[Dict[str, Any]], Set[str]]:
+    """Analyze a batch of documentation files in order, also returning the files that had issues."""
+    issues = []
+    files_with_issues = set()
+    for doc_file in doc_files:
+        file_issues = _analyze_doc_file(doc_file)
+        if file_issues:
+            issues.extend(file_issues)
+            files_with_issues.add(doc_file)
+    return issues, files_with_issues
+
 class ToolExecutor:
     """Handles Force tool execution with monitoring and validation."""
     
@@ -23,6 +293,21 @@ class ToolExecutor:
         """Initialize the tool executor with reference to Force engine."""
         self.force_engine = force_engine
         self._active_executions = {}
+        # Long-lived `git cat-file --batch-check` process, bound to one event loop and working directory
+        self._git_helper: Optional[asyncio.subprocess.Process] = None
+        self._git_helper_key = None
+        # Serialises spawning and querying the helper; created per event loop
+        self._git_helper_lock: Optional[asyncio.Lock] = None
+        self._git_helper_lock_loop = None
+        # Recent doc glob expansions keyed by (pattern, cwd, cwd mtime), with their creation time
+        self._glob_cache: Dict[Tuple[str, str, int], Tuple[float, List[str]]] = {}
+        # Bound on concurrent subprocesses; the semaphore is created per event loop
+        max_concurrency = getattr(force_engine, "max_subprocess_concurrency", None)
+        if not isinstance(max_concurrency, int) or max_concurrency < 1:
+            max_concurrency = os.cpu_count() or 1
+        self._max_concurrency = max_concurrency
+        self._proc_sem: Optional[asyncio.Semaphore] = None
+        self._proc_sem_loop = None
     
     async def execute_tool_command(self, tool: Dict[str, Any], parameters: Dict[str, Any], 
                                  context: Optional[Dict[str, Any]] = None) -> Any:
@@ -87,24 +372,21 @@ class ToolExecutor:
         }
         
         try:
-            # Check for changes
-            status_result = await self._run_command("git status --porcelain")
-            if not status_result["stdout"].strip():
-                raise ValueError("No changes to commit")
-            
-            # Stage files
+            # Check for changes; only the full status listing needs its output
             if include_files:
-                for file_path in include_files:
-                    if file_path not in exclude_files:
-                        await self._run_command(f"git add {file_path}")
-                        result["files_staged"].append(file_path)
+                if not await self._has_worktree_changes():
+                    raise ValueError("No changes to commit")
+                candidate_files = include_files
             else:
-                # Stage all modified files except excluded ones
-                changed_files = [line.split()[1] for line in status_result["stdout"].strip().split('\n') if line.strip()]
-                for file_path in changed_files:
-                    if file_path not in exclude_files:
-                        await self._run_command(f"git add {file_path}")
-                        result["files_staged"].append(file_path)
+                status_result = await self._run_command(["git", "status", "--porcelain=v2", "-z", "--no-renames"])
+                if not status_result["stdout"]:
+                    raise ValueError("No changes to commit")
+                # Stage all modified files when no include list is given
+                candidate_files = _parse_porcelain_v2_paths(status_result["stdout"])
+            excluded = set(exclude_files)
+            files_to_stage = [file_path for file_path in candidate_files if file_path not in excluded]
+            
+            result["files_staged"].extend(files_to_stage)
             
             # Generate commit message if not provided
             if not message:
@@ -112,13 +394,31 @@ class ToolExecutor:
             
             result["commit_message"] = message
             
-            if not dry_run:
-                # Perform the commit
-                commit_result = await self._run_command(f'git commit -m "{message}"')
+            if dry_run:
+                if files_to_stage:
+                    add_result = await self._run_command(["git", "add", "--", *files_to_stage])
+                    if add_result["returncode"] != 0:
+                        await self._stage_files_individually(files_to_stage)
+            else:
+                # Stage and commit in one shell; a failed add exits with its own code
+                commit_argv = ["git", "commit", "-m", message]
+                if files_to_stage:
+                    add_command = "git add -- " + " ".join(shlex.quote(f) for f in files_to_stage)
+                    commit_command = " ".join(shlex.quote(arg) for arg in commit_argv)
+                    commit_result = await self._run_shell(f"{add_command} || exit {STAGE_FAILED_EXIT_CODE}; {commit_command}")
+                    if commit_result["returncode"] == STAGE_FAILED_EXIT_CODE:
+                        await self._stage_files_individually(files_to_stage)
+                        commit_result = await self._run_command(commit_argv)
+                else:
+                    commit_result = await self._run_command(commit_argv)
+                
                 if commit_result["returncode"] == 0:
-                    # Get commit hash
-                    hash_result = await self._run_command("git rev-parse HEAD")
-                    result["commit_hash"] = hash_result["stdout"].strip()
+                    # Read the new hash from the ref files, falling back to git when they are not plain
+                    commit_hash = _read_head_sha(".")
+                    if commit_hash is None:
+                        hash_result = await self._run_command_small(["git", "rev-parse", "HEAD"])
+                        commit_hash = hash_result["stdout"].strip()
+                    result["commit_hash"] = commit_hash
                 else:
                     raise ValueError(f"Commit failed: {commit_result['stderr']}")
             
@@ -130,6 +430,22 @@ class ToolExecutor:
             result["error"] = str(e)
             return result
     
+    async def _has_worktree_changes(self) -> bool:
+        """Check for changes by diff exit codes, listing untracked files only when both diffs are clean."""
+        unstaged, staged = await asyncio.gather(
+            self._run_command_small(["git", "diff", "--quiet"]),
+            self._run_command_small(["git", "diff", "--cached", "--quiet"])
+        )
+        if unstaged["returncode"] == 1 or staged["returncode"] == 1:
+            return True
+        untracked = await self._run_command_small(["git", "ls-files", "--others", "--exclude-standard", "-z"])
+        return bool(untracked["stdout"])
+    
+    async def _stage_files_individually(self, files: List[str]) -> None:
+        """Stage files one at a time, used when one bad path fails a batched git add."""
+        for file_path in files:
+            await self._run_command(["git", "add", "--", file_path])
+    
     async def _execute_git_branch(self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute git branch creation."""
         branch_name = parameters["branchName"]
@@ -152,12 +468,11 @@ class ToolExecutor:
         
         try:
             # Check if branch already exists
-            branch_check = await self._run_command(f"git branch --list {formatted_branch_name}")
-            if branch_check["stdout"].strip():
+            if await self._git_object_exists(f"refs/heads/{formatted_branch_name}"):
                 raise ValueError(f"Branch {formatted_branch_name} already exists")
             
             # Create branch
-            create_result = await self._run_command(f"git checkout -b {formatted_branch_name} {base_branch}")
+            create_result = await self._run_command(["git", "checkout", "-b", formatted_branch_name, base_branch])
             if create_result["returncode"] != 0:
                 raise ValueError(f"Failed to create branch: {create_result['stderr']}")
             
@@ -190,63 +505,28 @@ class ToolExecutor:
             for pattern in target_files:
                 if pattern.startswith("**"):
                     # Use glob to find files
-                    from pathlib import Path
-                    files = list(Path(".").glob(pattern))
-                    doc_files.extend([str(f) for f in files if f.is_file()])
+                    doc_files.extend(self._cached_glob(pattern))
                 elif os.path.exists(pattern):
                     doc_files.append(pattern)
             
             result["files_analyzed"] = doc_files
             
-            # Analyze each file
-            for doc_file in doc_files:
-                if os.path.exists(doc_file):
-                    try:
-                        with open(doc_file, 'r', encoding='utf-8') as f:
-                            content = f.read()
-                        
-                        # Basic analysis
-                        if len(content.strip()) == 0:
-                            result["issues_found"].append({
-                                "file": doc_file,
-                                "type": "empty_file",
-                                "severity": "warning",
-                                "message": "File is empty"
-                            })
-                        
-                        # Check for basic structure (headers, etc.)
-                        if not content.startswith('#'):
-                            result["issues_found"].append({
-                                "file": doc_file,
-                                "type": "missing_header",
-                                "severity": "info",
-                                "message": "File does not start with a header"
-                            })
-                        
-                        # TODO: Implement link checking and code example validation
-                        
-                    except Exception as e:
-                        result["issues_found"].append({
-                            "file": doc_file,
-                            "type": "read_error",
-                            "severity": "error",
-                            "message": f"Could not read file: {str(e)}"
-                        })
+            # Analyze files in worker-thread batches so small reads share one hand-off instead of one each
+            batches = [doc_files[i:i + DOC_ANALYSIS_BATCH_SIZE] for i in range(0, len(doc_files), DOC_ANALYSIS_BATCH_SIZE)]
+            batch_issues = await asyncio.gather(*(asyncio.to_thread(_analyze_doc_files, batch) for batch in batches))
+            files_with_issues = set()
+            for issues, batch_files in batch_issues:
+                result["issues_found"].extend(issues)
+                files_with_issues |= batch_files
             
             if generate_report:
                 result["report"] = {
                     "total_files": len(doc_files),
-                    "files_with_issues": len(set(issue["file"] for issue in result["issues_found"])),
+                    "files_with_issues": len(files_with_issues),
                     "total_issues": len(result["issues_found"]),
-                    "issue_breakdown": {}
+                    # Categorize issues
+                    "issue_breakdown": dict(Counter(issue["type"] for issue in result["issues_found"]))
                 }
-                
-                # Categorize issues
-                for issue in result["issues_found"]:
-                    issue_type = issue["type"]
-                    if issue_type not in result["report"]["issue_breakdown"]:
-                        result["report"]["issue_breakdown"][issue_type] = 0
-                    result["report"]["issue_breakdown"][issue_type] += 1
             
             result["success"] = True
             return result
@@ -256,6 +536,21 @@ class ToolExecutor:
             result["error"] = str(e)
             return result
     
+    def _cached_glob(self, pattern: str) -> List[str]:
+        """Expand a glob pattern to files, reusing a recent expansion for the same directory state."""
+        cwd = os.getcwd()
+        key = (pattern, cwd, os.stat(cwd).st_mtime_ns)
+        now = time.monotonic()
+        cached = self._glob_cache.get(key)
+        if cached is not None and now - cached[0] < GLOB_CACHE_TTL:
+            return cached[1]
+        
+        files = [str(f) for f in Path(".").glob(pattern) if f.is_file()]
+        if len(self._glob_cache) >= GLOB_CACHE_LIMIT:
+            self._glob_cache.clear()
+        self._glob_cache[key] = (now, files)
+        return files
+    
     async def _execute_code_quality(self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute code quality analysis."""
         target_files = parameters.get("targetFiles", ["**/*.py"])
@@ -272,53 +567,21 @@ class ToolExecutor:
         }
         
         try:
-            # Run each linter
-            for linter in linters:
-                if linter == "flake8":
-                    linter_result = await self._run_command("flake8 --format=json .", capture_output=True)
-                    result["linters_run"].append(linter)
-                    
-                    if linter_result["stdout"]:
-                        try:
-                            issues = json.loads(linter_result["stdout"])
-                            result["issues_found"].extend(issues)
-                        except json.JSONDecodeError:
-                            # Fallback to text parsing
-                            lines = linter_result["stdout"].strip().split('\n')
-                            for line in lines:
-                                if ':' in line:
-                                    result["issues_found"].append({
-                                        "linter": linter,
-                                        "message": line.strip()
-                                    })
-                
-                elif linter == "mypy":
-                    linter_result = await self._run_command("mypy --show-error-codes .", capture_output=True)
-                    result["linters_run"].append(linter)
-                    
-                    if linter_result["stdout"]:
-                        lines = linter_result["stdout"].strip().split('\n')
-                        for line in lines:
-                            if ':' in line and 'error:' in line:
-                                result["issues_found"].append({
-                                    "linter": linter,
-                                    "message": line.strip()
-                                })
-                
-                # TODO: Implement other linters (pylint, black, isort)
+            # Run the supported linters concurrently
+            # TODO: Implement other linters (pylint, black, isort)
+            supported = [linter for linter in linters
+                         if linter in LINTER_COMMANDS or (linter == "pyflakes" and PYFLAKES_AVAILABLE)]
+            linter_issues = await asyncio.gather(*(self._run_linter(linter) for linter in supported))
+            for linter, issues in zip(supported, linter_issues):
+                result["linters_run"].append(linter)
+                result["issues_found"].extend(issues)
             
             if generate_report:
                 result["report"] = {
                     "linters_run": len(result["linters_run"]),
                     "total_issues": len(result["issues_found"]),
-                    "issues_by_linter": {}
+                    "issues_by_linter": dict(Counter(issue.get("linter", "unknown") for issue in result["issues_found"]))
                 }
-                
-                for issue in result["issues_found"]:
-                    linter = issue.get("linter", "unknown")
-                    if linter not in result["report"]["issues_by_linter"]:
-                        result["report"]["issues_by_linter"][linter] = 0
-                    result["report"]["issues_by_linter"][linter] += 1
             
             result["success"] = True
             return result
@@ -328,6 +591,23 @@ class ToolExecutor:
             result["error"] = str(e)
             return result
     
+    async def _run_linter(self, linter: str, timeout: int = 300) -> List[Dict[str, Any]]:
+        """Run one linter, parsing its issues from stdout as lines arrive."""
+        if linter == "pyflakes":
+            # Opt-in fast path without an interpreter startup; pyflakes is CPU-bound, so one thread checks every file
+            return await asyncio.to_thread(_pyflakes_check_project, ".")
+        
+        issues = []
+        
+        def on_stdout_line(line: str) -> None:
+            issue = _parse_linter_line(linter, line.strip())
+            if issue is not None:
+                issues.append(issue)
+        
+        # A linter that is not installed reports no issues
+        await self._run_command_streaming(LINTER_COMMANDS[linter], on_stdout_line, timeout=timeout)
+        return issues
+    
     async def _execute_project_analysis(self, parameters: Dict[str, Any], context: Optional[Dict[str, Any]]) -> Dict[str, Any]:
         """Execute project structure analysis."""
         project_type = parameters.get("projectType", "python-package")
@@ -344,6 +624,9 @@ class ToolExecutor:
         }
         
         try:
+            # One directory listing answers every top-level existence check below
+            top_level = _scan_top_level(".") if check_structure or suggest_improvements else {}
+            
             # Analyze project structure
             if check_structure:
                 expected_files = {
@@ -354,7 +637,7 @@ class ToolExecutor:
                 }.get(project_type, [])
                 
                 for expected_file in expected_files:
-                    if not os.path.exists(expected_file):
+                    if not _top_level_exists(top_level, expected_file):
                         result["structure_issues"].append({
                             "type": "missing_file",
                             "file": expected_file,
@@ -365,27 +648,25 @@ class ToolExecutor:
             # Check naming conventions
             if check_naming:
                 # Check for Python naming conventions
-                for root, dirs, files in os.walk("."):
-                    for file in files:
-                        if file.endswith(".py"):
-                            if "-" in file:  # Python files should use underscores
-                                result["naming_issues"].append({
-                                    "type": "naming_convention",
-                                    "file": os.path.join(root, file),
-                                    "severity": "info",
-                                    "message": "Python files should use underscores instead of hyphens"
-                                })
+                for file_path in _iter_py_files("."):
+                    if "-" in os.path.basename(file_path):  # Python files should use underscores
+                        result["naming_issues"].append({
+                            "type": "naming_convention",
+                            "file": file_path,
+                            "severity": "info",
+                            "message": "Python files should use underscores instead of hyphens"
+                        })
             
             # Generate suggestions
             if suggest_improvements:
-                if project_type == "python-package" and not os.path.exists("tests/"):
+                if project_type == "python-package" and not _top_level_exists(top_level, "tests/"):
                     result["suggestions"].append({
                         "type": "add_testing",
                         "priority": "high",
                         "message": "Consider adding a tests/ directory with unit tests"
                     })
                 
-                if not os.path.exists(".gitignore"):
+                if not _top_level_exists(top_level, ".gitignore"):
                     result["suggestions"].append({
                         "type": "add_gitignore",
                         "priority": "medium",
@@ -407,7 +688,7 @@ class ToolExecutor:
             # Substitute parameters in command if needed
             formatted_command = command.format(**parameters)
             
-            result = await self._run_command(formatted_command, timeout=timeout)
+            result = await self._run_shell(formatted_command, timeout=timeout)
             
             return {
                 "command": formatted_command,
@@ -424,16 +705,183 @@ class ToolExecutor:
                 "error": str(e)
             }
     
-    async def _run_command(self, command: str, timeout: int = 300, capture_output: bool = True) -> Dict[str, Any]:
-        """Run a shell command with proper error handling."""
+    def _git_lock(self) -> asyncio.Lock:
+        """Return the git helper lock for the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._git_helper_lock is None or self._git_helper_lock_loop is not loop:
+            self._git_helper_lock = asyncio.Lock()
+            self._git_helper_lock_loop = loop
+        return self._git_helper_lock
+    
+    async def _git_query(self, query: str) -> str:
+        """Answer one object query through the long-lived git helper, spawning it on first use."""
+        key = (asyncio.get_running_loop(), os.getcwd())
+        # Check, spawn and query under one lock so concurrent first queries share a single helper
+        async with self._git_lock():
+            if self._git_helper is None or self._git_helper_key != key or self._git_helper.returncode is not None:
+                await self._stop_git_helper()
+                self._git_helper = await asyncio.create_subprocess_exec(
+                    "git", "cat-file", "--batch-check",
+                    stdin=asyncio.subprocess.PIPE,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL,
+                    cwd=key[1]
+                )
+                self._git_helper_key = key
+            
+            helper = self._git_helper
+            try:
+                helper.stdin.write(query.encode("utf-8") + b"\n")
+                await helper.stdin.drain()
+                line = await helper.stdout.readline()
+            except (BrokenPipeError, ConnectionResetError):
+                # The helper exits at once outside a git repository
+                return ""
+        return line.decode("utf-8").strip()
+    
+    async def _git_object_exists(self, name: str) -> bool:
+        """Check whether a ref or object name resolves in the current repository."""
+        answer = await self._git_query(name)
+        return bool(answer) and not answer.endswith((" missing", " ambiguous"))
+    
+    async def aclose(self) -> None:
+        """Stop the git helper process, if one is running."""
+        async with self._git_lock():
+            await self._stop_git_helper()
+    
+    async def __aenter__(self) -> "ToolExecutor":
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.aclose()
+    
+    async def _stop_git_helper(self) -> None:
+        """Stop the git helper process; callers hold the helper lock."""
+        helper, self._git_helper = self._git_helper, None
+        self._git_helper_key = None
+        if helper is None or helper.returncode is not None:
+            return
         try:
-            process = await asyncio.create_subprocess_shell(
-                command,
-                stdout=asyncio.subprocess.PIPE if capture_output else None,
-                stderr=asyncio.subprocess.PIPE if capture_output else None,
-                cwd=os.getcwd()
-            )
+            helper.stdin.close()
+            await asyncio.wait_for(helper.wait(), timeout=5)
+        except Exception:
+            # The helper may belong to an event loop that has since closed
+            try:
+                helper.kill()
+            except Exception:
+                pass
+    
+    def _process_semaphore(self) -> asyncio.Semaphore:
+        """Return the semaphore bounding concurrent subprocesses on the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._proc_sem is None or self._proc_sem_loop is not loop:
+            self._proc_sem = asyncio.Semaphore(self._max_concurrency)
+            self._proc_sem_loop = loop
+        return self._proc_sem
+    
+    async def _run_command(self, argv: List[str], timeout: int = 300, capture_output: bool = True) -> Dict[str, Any]:
+        """Run a program directly, without a shell, with proper error handling."""
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+        async with self._process_semaphore():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=pipe,
+                    stderr=pipe
+                )
+            except FileNotFoundError:
+                # Report a missing program the way a shell would
+                return {"returncode": 127, "stdout": "", "stderr": f"{argv[0]}: command not found"}
+            except Exception as e:
+                raise ValueError(f"Command execution failed: {str(e)}")
+            return await self._collect_output(process, timeout)
+    
+    async def _run_command_small(self, argv: List[str], timeout: int = 60) -> Dict[str, Any]:
+        """Run a short git query, keeping at most SMALL_OUTPUT_LIMIT bytes of stdout and no stderr."""
+        async with self._process_semaphore():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.DEVNULL
+                )
+            except FileNotFoundError:
+                return {"returncode": 127, "stdout": "", "stderr": ""}
+            except Exception as e:
+                raise ValueError(f"Command execution failed: {str(e)}")
+            
+            async def read_and_wait() -> bytes:
+                data = await process.stdout.read(SMALL_OUTPUT_LIMIT)
+                # Discard any excess so the process never blocks on a full pipe
+                while await process.stdout.read(65536):
+                    pass
+                await process.wait()
+                return data
+            
+            try:
+                stdout = await asyncio.wait_for(read_and_wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                process.terminate()
+                await process.wait()
+                raise ValueError(f"Command timed out after {timeout} seconds")
+            return {"returncode": process.returncode, "stdout": stdout.decode("utf-8", "replace"), "stderr": ""}
+    
+    async def _run_command_streaming(self, argv: List[str], on_stdout_line: Callable[[str], None],
+                                     on_stderr_line: Optional[Callable[[str], None]] = None,
+                                     timeout: int = 300) -> int:
+        """Run a program, handing each output line to a callback as it arrives; returns the exit code."""
+        async with self._process_semaphore():
+            try:
+                process = await asyncio.create_subprocess_exec(
+                    *argv,
+                    stdout=asyncio.subprocess.PIPE,
+                    stderr=asyncio.subprocess.PIPE
+                )
+            except FileNotFoundError:
+                if on_stderr_line is not None:
+                    on_stderr_line(f"{argv[0]}: command not found")
+                return 127
+            except Exception as e:
+                raise ValueError(f"Command execution failed: {str(e)}")
             
+            async def drain(stream: asyncio.StreamReader, on_line: Optional[Callable[[str], None]]) -> None:
+                async for raw_line in stream:
+                    if on_line is not None:
+                        on_line(raw_line.decode("utf-8", "replace"))
+            
+            try:
+                await asyncio.wait_for(
+                    asyncio.gather(
+                        drain(process.stdout, on_stdout_line),
+                        drain(process.stderr, on_stderr_line),
+                        process.wait()
+                    ),
+                    timeout=timeout
+                )
+            except asyncio.TimeoutError:
+                process.terminate()
+                await process.wait()
+                raise ValueError(f"Command timed out after {timeout} seconds")
+            return process.returncode
+        
+    
+    async def _run_shell(self, command: str, timeout: int = 300, capture_output: bool = True) -> Dict[str, Any]:
+        """Run a shell command line, for tool commands and chained git steps."""
+        pipe = asyncio.subprocess.PIPE if capture_output else None
+        async with self._process_semaphore():
+            try:
+                process = await asyncio.create_subprocess_shell(
+                    command,
+                    stdout=pipe,
+                    stderr=pipe
+                )
+            except Exception as e:
+                raise ValueError(f"Command execution failed: {str(e)}")
+            return await self._collect_output(process, timeout)
+    
+    async def _collect_output(self, process: asyncio.subprocess.Process, timeout: int) -> Dict[str, Any]:
+        """Wait for a process and collect its decoded output."""
+        try:
             stdout, stderr = await asyncio.wait_for(
                 process.communicate(),
                 timeout=timeout
@@ -446,9 +894,8 @@ class ToolExecutor:
             }
             
         except asyncio.TimeoutError:
-            if process:
-                process.terminate()
-                await process.wait()
+            process.terminate()
+            await process.wait()
             raise ValueError(f"Command timed out after {timeout} seconds")
         except Exception as e:
             raise ValueError(f"Command execution failed: {str(e)}")
@@ -5,14 +5,64 @@ Provides the base classes and registration mechanism for Force tools.
 """
 
 import importlib
+import importlib.metadata
 import logging
 import os
 import pkgutil
 import json
-from typing import Dict, Any, List, Optional, Type, Set
+import marshal
+import threading
+from typing import Dict, Any, List, Optional, Type, Set, Tuple, Callable
+
+from force.user_cache import cache_file_for, write_cache_file
+
+# Prefer orjson for parsing tool definition files when it is installed
+try:
+    import orjson
+    _loads = orjson.loads
+    ORJSON_AVAILABLE = True
+except ImportError:
+    _loads = json.loads
+    ORJSON_AVAILABLE = False
 
 logger = logging.getLogger(__name__)
 
+# Entry point group that installed packages use to declare tool executors
+TOOL_ENTRY_POINT_GROUP = "force.tools"
+
+# Entry points are read from package metadata once per process and shared by every registry
+_EP_CACHE: Optional[Tuple[importlib.metadata.EntryPoint, ...]] = None
+_EP_CACHE_LOCK = threading.Lock()
+
+def _tool_entry_points() -> Tuple[importlib.metadata.EntryPoint, ...]:
+    """Return the declared tool executor entry points, memoized."""
+    global _EP_CACHE
+    if _EP_CACHE is None:
+        with _EP_CACHE_LOCK:
+            if _EP_CACHE is None:
+                _EP_CACHE = tuple(importlib.metadata.entry_points(group=TOOL_ENTRY_POINT_GROUP))
+    return _EP_CACHE
+
+# Parsed tool definition files, cached with marshal in the per-user cache and keyed by path with (mtime_ns, size)
+TOOL_CACHE_FILE = "tool_definitions.marshal"
+
+def _load_tool_cache(cache_file) -> Dict[str, Tuple[int, int, Any]]:
+    """Load the tool definition cache, treating a missing or unreadable cache as empty."""
+    try:
+        cache = marshal.loads(cache_file.read_bytes())
+    except (OSError, EOFError, ValueError, TypeError):
+        return {}
+    if not isinstance(cache, dict):
+        return {}
+    return {path: entry for path, entry in cache.items() if isinstance(entry, tuple) and len(entry) == 3}
+
+def _save_tool_cache(cache_file, cache: Dict[str, Tuple[int, int, Any]]) -> None:
+    """Write the tool definition cache atomically."""
+    try:
+        write_cache_file(cache_file, marshal.dumps(cache))
+    except (OSError, ValueError) as e:
+        logger.debug(f"Could not write tool definition cache {cache_file}: {e}")
+
 class BaseToolExecutor:
     """Base class for all tool executors."""
     
@@ -41,6 +91,11 @@ class BaseToolExecutor:
             "category": self.tool_category,
             "description": self.tool_description,
         }
+    
+    @classmethod
+    def class_metadata(cls) -> Dict[str, Any]:
+        """Return tool metadata from class attributes, without creating an executor."""
+        return BaseToolExecutor.get_metadata(cls)
 
     @classmethod
     def supports_tool_id(cls, tool_id: str) -> bool:
@@ -48,35 +103,75 @@ class BaseToolExecutor:
         return cls.tool_id == tool_id
 
 
+# Executor classes marked with @register_tool, in definition order
+_EXECUTOR_CLASSES: List[Type[BaseToolExecutor]] = []
+
+def register_tool(executor_class: Type[BaseToolExecutor]) -> Type[BaseToolExecutor]:
+    """Class decorator that makes a tool executor discoverable by ToolRegistry."""
+    _EXECUTOR_CLASSES.append(executor_class)
+    return executor_class
+
+
+def import_builtin_tools() -> None:
+    """Import the built-in tool modules so their @register_tool executors are recorded."""
+    current_dir = os.path.dirname(os.path.abspath(__file__))
+    for _, name, ispkg in pkgutil.iter_modules([current_dir]):
+        if not name.startswith('_'):
+            try:
+                importlib.import_module(f'force.tools.{name}')
+            except Exception as e:
+                logger.error(f"Error importing tool module {name}: {e}")
+
+
 class ToolRegistry:
     """Registry for all tool executors."""
     
     def __init__(self, force_engine):
         self.force_engine = force_engine
         self._executors: Dict[str, Type[BaseToolExecutor]] = {}
+        # Executors declared but not yet imported, resolved into _executors on first use
+        self._executor_factories: Dict[str, Callable[[], Type[BaseToolExecutor]]] = {}
         self._discovered = False
-        self._registered_classes = set()  # Track registered executor classes
+        self._discovery_in_progress = False
         self._dynamic_executor_class_names = set()  # Track dynamic executor class names
         
     def register_tool_executor(self, executor_class: Type[BaseToolExecutor]) -> None:
         """Register a tool executor class."""
-        # Only register concrete classes (not abstract base or JsonToolExecutor itself)
-        if executor_class is JsonToolExecutor or executor_class.tool_id is None:
+        # Only register concrete classes (not abstract bases such as JsonToolExecutor)
+        if executor_class.tool_id is None:
             logger.debug(f"Skipping registration of {executor_class.__name__} (abstract or no tool_id)")
             return
-        if executor_class in self._registered_classes:
+        if self._executors.get(executor_class.tool_id) is executor_class:
             logger.debug(f"Executor class {executor_class.__name__} already registered, skipping duplicate.")
             return
         if executor_class.tool_id in self._executors:
             logger.warning(f"Tool executor for {executor_class.tool_id} already registered, overriding")
         self._executors[executor_class.tool_id] = executor_class
-        self._registered_classes.add(executor_class)
+        self._executor_factories.pop(executor_class.tool_id, None)
         logger.debug(f"Registered tool executor for {executor_class.tool_id}")
     
     def get_executor_class(self, tool_id: str, ensure_discovery: bool = True) -> Optional[Type[BaseToolExecutor]]:
         """Get the executor class for a tool ID."""
         if ensure_discovery:
             self._ensure_discovery()
+        executor_class = self._executors.get(tool_id)
+        if executor_class is None and tool_id in self._executor_factories:
+            executor_class = self._resolve_factory(tool_id)
+        return executor_class
+    
+    def has_executor(self, tool_id: str, ensure_discovery: bool = True) -> bool:
+        """Check whether an executor is registered or declared for a tool ID, without importing it."""
+        if ensure_discovery:
+            self._ensure_discovery()
+        return tool_id in self._executors or tool_id in self._executor_factories
+    
+    def _resolve_factory(self, tool_id: str) -> Optional[Type[BaseToolExecutor]]:
+        """Import a declared executor and register it."""
+        factory = self._executor_factories.pop(tool_id)
+        try:
+            self.register_tool_executor(factory())
+        except Exception as e:
+            logger.error(f"Error loading tool executor for {tool_id}: {e}")
         return self._executors.get(tool_id)
     
     def create_executor(self, tool_id: str) -> Optional[BaseToolExecutor]:
@@ -91,47 +186,73 @@ class ToolRegistry:
         self._ensure_discovery()
         result = []
         for tool_id, executor_class in self._executors.items():
-            instance = executor_class(self.force_engine)
-            result.append(instance.get_metadata())
+            if executor_class.get_metadata is BaseToolExecutor.get_metadata:
+                result.append(executor_class.class_metadata())
+            else:
+                result.append(executor_class(self.force_engine).get_metadata())
+        
+        # Declared executors are described from their JSON definition when there is one
+        for tool_id in list(self._executor_factories):
+            definition = tool_definition_registry.get(tool_id)
+            if definition is not None:
+                result.append({
+                    "id": tool_id,
+                    "name": definition.name,
+                    "category": definition.category,
+                    "description": definition.description,
+                })
+            else:
+                executor_class = self._resolve_factory(tool_id)
+                if executor_class is not None:
+                    result.append(executor_class.class_metadata())
         return result
     
     def _ensure_discovery(self) -> None:
         """Ensure tool discovery has run."""
-        if not self._discovered:
+        # Lookups made while discovering do not start it again
+        if self._discovered or self._discovery_in_progress:
+            return
+        self._discovery_in_progress = True
+        try:
             self._discover_tools()
+            # Only marked once discovery succeeds, so a failed discovery is retried on the next lookup
             self._discovered = True
+        finally:
+            self._discovery_in_progress = False
     
     def _discover_tools(self) -> None:
         """Discover and register all tool executors."""
-        if hasattr(self, '_discovery_in_progress') and self._discovery_in_progress:
-            logger.debug("Tool discovery already in progress, skipping re-entry")
-            return
-            
-        try:
-            self._discovery_in_progress = True
-            
-            # First, import any modules in the tools package
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            for _, name, ispkg in pkgutil.iter_modules([current_dir]):
-                if not name.startswith('_'):
-                    try:
-                        importlib.import_module(f'force.tools.{name}')
-                    except Exception as e:
-                        logger.error(f"Error importing tool module {name}: {e}")
-                        
-            # Register only concrete BaseToolExecutor subclasses (skip abstract/JsonToolExecutor)
-            for subclass in BaseToolExecutor.__subclasses__():
-                if subclass is JsonToolExecutor or getattr(subclass, 'tool_id', None) is None:
-                    continue
-                self.register_tool_executor(subclass)
-                
-            # Add JSON-defined tool executors without triggering discovery
-            register_json_tool_executors(self, skip_discovery=True)
-            
-            logger.info(f"Discovered {len(self._executors)} tool executors")
+        # Built-in executors are always imported, so installed and source runs see the same tools
+        import_builtin_tools()
+                    
+        # Register the executors marked with @register_tool that have been imported
+        for executor_class in _EXECUTOR_CLASSES:
+            self.register_tool_executor(executor_class)
+        
+        # Executors defined before @register_tool existed are still found as direct subclasses
+        decorated = set(_EXECUTOR_CLASSES)
+        for subclass in BaseToolExecutor.__subclasses__():
+            if (subclass in decorated or subclass is JsonToolExecutor
+                    or subclass.tool_id is None or subclass.tool_id in self._executors):
+                continue
+            logger.warning(f"{subclass.__module__}.{subclass.__name__} was found without @register_tool; "
+                           f"discovery by subclassing is deprecated")
+            self.register_tool_executor(subclass)
+        
+        # Plugin executors from entry points, named by tool ID and imported when first used;
+        # a built-in executor keeps its tool ID, and the first entry point wins among plugins
+        for entry_point in _tool_entry_points():
+            if entry_point.name in self._executors:
+                logger.warning(f"Entry point {entry_point.value} ignored, {entry_point.name} is a built-in tool")
+            elif entry_point.name in self._executor_factories:
+                logger.warning(f"Entry point {entry_point.value} ignored, {entry_point.name} is already provided by a plugin")
+            else:
+                self._executor_factories[entry_point.name] = entry_point.load
             
-        finally:
-            self._discovery_in_progress = False
+        # Add JSON-defined tool executors without triggering discovery
+        register_json_tool_executors(self, skip_discovery=True)
+        
+        logger.info(f"Discovered {len(self._executors) + len(self._executor_factories)} tool executors")
         
 # Function to load tool definitions from the .force directory
 def load_tool_definitions(force_dir):
@@ -145,10 +266,22 @@ def load_tool_definitions(force_dir):
         tools_dir = force_dir / "tools"
         if tools_dir.exists() and tools_dir.is_dir():
             logger.info(f"Loading tool definitions from {tools_dir}")
+            cache_file = cache_file_for(tools_dir, TOOL_CACHE_FILE)
+            cache = _load_tool_cache(cache_file)
+            fresh_cache = {}
+            cache_changed = False
             for json_file in tools_dir.glob("*.json"):
                 try:
-                    with open(json_file, 'r') as f:
-                        tool_data = json.load(f)
+                    # Only parse files whose stat changed since they were cached
+                    stat = json_file.stat()
+                    cache_key = str(json_file)
+                    cached = cache.get(cache_key)
+                    if cached is not None and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+                        tool_data = cached[2]
+                    else:
+                        tool_data = _loads(json_file.read_bytes())
+                        cache_changed = True
+                    fresh_cache[cache_key] = (stat.st_mtime_ns, stat.st_size, tool_data)
                         
                     # Handle both single tools and collections
                     if "id" in tool_data and isinstance(tool_data.get("id"), str):
@@ -169,6 +302,9 @@ def load_tool_definitions(force_dir):
                         
                 except Exception as e:
                     logger.error(f"Error loading tool definition from {json_file}: {e}")
+            
+            if cache_changed or fresh_cache.keys() != cache.keys():
+                _save_tool_cache(cache_file, fresh_cache)
         else:
             logger.warning(f"Tool definitions directory not found: {tools_dir}")
             
@@ -180,6 +316,8 @@ def load_tool_definitions(force_dir):
 class ToolDefinition:
     """Represents a tool definition loaded from a JSON file."""
     
+    __slots__ = ("data", "id", "name", "category", "description", "parameters", "execution", "metadata")
+    
     def __init__(self, definition_data: Dict[str, Any]):
         """Initialize a tool definition from JSON data."""
         self.data = definition_data
@@ -265,7 +403,7 @@ def register_json_tool_executors(registry: ToolRegistry, skip_discovery: bool =
         registry._dynamic_executor_class_names = set()
     for tool_id, definition in tool_definition_registry.get_all().items():
         # Check if there's already a native executor for this tool
-        if registry.get_executor_class(tool_id, ensure_discovery=not skip_discovery):
+        if registry.has_executor(tool_id, ensure_discovery=not skip_discovery):
             logger.debug(f"Native executor already exists for {tool_id}, skipping JSON registration")
             continue
         # Avoid duplicate dynamic class creation
@@ -9,10 +9,11 @@ import os
 import subprocess
 from typing import Dict, Any, Optional, List
 
-from force.tools import BaseToolExecutor
+from force.tools import BaseToolExecutor, register_tool
 
 logger = logging.getLogger(__name__)
 
+@register_tool
 class GitStatusExecutor(BaseToolExecutor):
     """Executor for git-status tool."""
     
@@ -79,6 +80,7 @@ class GitStatusExecutor(BaseToolExecutor):
             }
 
 
+@register_tool
 class GitCommitExecutor(BaseToolExecutor):
     """Executor for git-commit tool."""
     
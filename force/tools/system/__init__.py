@@ -11,7 +11,7 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
-from force.tools import BaseToolExecutor
+from force.tools import BaseToolExecutor, register_tool
 
 class ForceStartupValidator:
     """Handles Force component validation and fixing at system startup."""
@@ -86,6 +86,7 @@ class ForceStartupValidator:
             print(f"❌ Error running auto-fix: {e}")
             return False
 
+@register_tool
 class ForceSyncTool(BaseToolExecutor):
     """Tool for synchronizing Force components between default and project directories."""
     
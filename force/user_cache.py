@@ -0,0 +1,40 @@
+"""
+Per-user cache locations for the Force system.
+
+Caches are kept out of project and package directories, which may be
+read-only, shared between users, or checked into a repository.
+"""
+
+import hashlib
+import os
+import sys
+from pathlib import Path
+
+# Environment variable that overrides the cache root
+CACHE_DIR_ENV = "FORCE_CACHE_DIR"
+
+def user_cache_dir() -> Path:
+    """Return the per-user Force cache directory; it is not created."""
+    override = os.environ.get(CACHE_DIR_ENV)
+    if override:
+        return Path(override)
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(os.path.expanduser("~"), "AppData", "Local")
+    elif sys.platform == "darwin":
+        base = os.path.join(os.path.expanduser("~"), "Library", "Caches")
+    else:
+        base = os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache")
+    return Path(base) / "force"
+
+def cache_file_for(source_dir, name: str) -> Path:
+    """Return the cache file for data derived from a directory, keyed by its resolved path."""
+    digest = hashlib.sha256(str(Path(source_dir).resolve()).encode("utf-8")).hexdigest()[:16]
+    return user_cache_dir() / digest / name
+
+def write_cache_file(cache_file: Path, data: bytes) -> None:
+    """Write a cache file atomically, creating its directory; raises OSError on failure."""
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    tmp_file = cache_file.with_name(f".{cache_file.name}.{os.getpid()}.tmp")
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, cache_file)
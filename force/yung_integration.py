@@ -444,6 +444,7 @@ class YUNGForceIntegration:
         """Execute a compound command (multiple commands chained)."""
         commands = parsed_command.get("commands", [])
         results = []
+        overall_success = True
         
         for cmd in commands:
             # Parse each sub-command
@@ -455,6 +456,7 @@ class YUNGForceIntegration:
             
             # If any command fails, stop execution
             if not result.get("success", True):
+                overall_success = False
                 break
             
             # Update context with results for next command
@@ -462,7 +464,7 @@ class YUNGForceIntegration:
                 context.update(result.get("result", {}))
         
         return {
-            "success": all(r.get("success", True) for r in results),
+            "success": overall_success,
             "results": results,
             "execution_type": "compound"
         }
@@ -8,8 +8,12 @@ constraint validation, legacy agent integration, and YUNG command processing.
 
 import unittest
 import asyncio
+import gc
 import tempfile
 import json
+import shutil
+import subprocess
+import time
 from pathlib import Path
 from unittest.mock import Mock, patch
 import sys
@@ -19,7 +23,16 @@ import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from force import ForceEngine
-from force.legacy_adapter import LegacyAgentManager
+from force.legacy_adapter import LegacyAgentManager, VCMAForceAdapter
+from force.patterns import PatternRegistry, PATTERN_CACHE_FILE
+from force.system.force_component_auto_fixer import ForceComponentAutoFixer, PARALLEL_FIX_THRESHOLD
+from force.tool_executor import ToolExecutor, PYFLAKES_AVAILABLE, _PyflakesCollector, _analyze_doc_files
+import force.tools
+from force.tools import (
+    BaseToolExecutor, ToolDefinitionRegistry, ToolRegistry, import_builtin_tools, load_tool_definitions, TOOL_CACHE_FILE
+)
+from force.tools.git.status.tool import GitStatusExecutor
+from force.user_cache import CACHE_DIR_ENV, cache_file_for
 from force.yung_integration import YUNGForceIntegration
 
 
@@ -96,6 +109,511 @@ class TestForceEngine(unittest.TestCase):
             self.engine.execute_tool_sync('non_existent_tool', {})
 
 
+class TestPatternRegistry(unittest.TestCase):
+    """Test cases for the pattern registry."""
+
+    def setUp(self):
+        """Set up a temporary pattern directory and cache location."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.cache_dir.cleanup)
+        cache_env = patch.dict(os.environ, {CACHE_DIR_ENV: self.cache_dir.name})
+        cache_env.start()
+        self.addCleanup(cache_env.stop)
+
+    def _write_pattern(self, pattern_id):
+        with open(os.path.join(self.temp_dir.name, f"{pattern_id}.json"), 'w') as f:
+            json.dump({"id": pattern_id, "name": pattern_id}, f)
+
+    def test_refresh_on_directory_change(self):
+        """Test that added and removed pattern files are picked up."""
+        self._write_pattern('first')
+        registry = PatternRegistry(None, self.temp_dir.name)
+        self.assertIsNotNone(registry.get_pattern('first'))
+
+        self._write_pattern('second')
+        os.remove(os.path.join(self.temp_dir.name, 'first.json'))
+        self.assertIsNotNone(registry.get_pattern('second'))
+        self.assertIsNone(registry.get_pattern('first'))
+
+    def test_pattern_id_tracks_its_file(self):
+        """Test that renamed IDs are dropped and shared IDs survive removing one file."""
+        self._write_pattern('first')
+        with open(os.path.join(self.temp_dir.name, "copy.json"), 'w') as f:
+            json.dump({"id": "first", "name": "copy"}, f)
+        registry = PatternRegistry(None, self.temp_dir.name)
+        owner = registry._pattern_id_owners['first']
+        os.remove(os.path.join(self.temp_dir.name, "copy.json" if owner == "first.json" else "first.json"))
+        self.assertIsNotNone(registry.get_pattern('first'))
+
+        with open(os.path.join(self.temp_dir.name, owner), 'w') as f:
+            json.dump({"id": "renamed", "name": "renamed pattern"}, f)
+        registry.load_patterns()
+        self.assertIsNone(registry.get_pattern('first'))
+        self.assertIsNotNone(registry.get_pattern('renamed'))
+
+    def test_list_patterns_returns_copy(self):
+        """Test that list_patterns returns an independent list that tracks registry changes."""
+        self._write_pattern('first')
+        registry = PatternRegistry(None, self.temp_dir.name)
+        self.assertEqual(os.listdir(self.temp_dir.name), ['first.json'])
+        self.assertTrue(cache_file_for(self.temp_dir.name, PATTERN_CACHE_FILE).exists())
+        patterns = registry.list_patterns()
+        self.assertIsInstance(patterns, list)
+        patterns.append({"id": "caller"})
+        self.assertEqual(len(registry.list_patterns()), 1)
+
+        registry.register_pattern('extra', {"id": "extra"})
+        self.assertEqual(len(registry.list_patterns()), 2)
+
+
+def isolate_tool_registries(test_case):
+    """Give a test its own tool definition registry and executor list, restored on cleanup."""
+    # Import built-ins first so their one-time registrations land in the shared list, not the copy
+    import_builtin_tools()
+    definitions = ToolDefinitionRegistry()
+    for name, value in (("tool_definition_registry", definitions),
+                        ("_EXECUTOR_CLASSES", list(force.tools._EXECUTOR_CLASSES))):
+        patcher = patch.object(force.tools, name, value)
+        patcher.start()
+        test_case.addCleanup(patcher.stop)
+    return definitions
+
+
+class TestToolDefinitionLoading(unittest.TestCase):
+    """Test cases for loading JSON tool definitions."""
+
+    def setUp(self):
+        """Set up a temporary .force directory with one tool definition."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.force_dir = Path(self.temp_dir.name)
+        (self.force_dir / "tools").mkdir()
+        self.tool_file = self.force_dir / "tools" / "cached_tool.json"
+        cache_env = patch.dict(os.environ, {CACHE_DIR_ENV: os.path.join(self.temp_dir.name, "cache")})
+        cache_env.start()
+        self.addCleanup(cache_env.stop)
+        self.definitions = isolate_tool_registries(self)
+
+    def _write_tool(self, name):
+        self.tool_file.write_text(json.dumps({"id": "cached_tool_test", "name": name}))
+
+    def test_unchanged_files_are_read_from_cache(self):
+        """Test that a file with the same stat is served from the cache and a changed one is re-read."""
+        self._write_tool("first")
+        load_tool_definitions(self.force_dir)
+        cache_file = cache_file_for(self.force_dir / "tools", TOOL_CACHE_FILE)
+        self.assertTrue(str(cache_file).startswith(os.path.join(self.temp_dir.name, "cache")))
+        self.assertTrue(cache_file.exists())
+        stat = self.tool_file.stat()
+
+        # Same size and mtime: the cached definition is used
+        self._write_tool("other")
+        os.utime(self.tool_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        load_tool_definitions(self.force_dir)
+        self.assertEqual(self.definitions.get("cached_tool_test").name, "first")
+
+        self._write_tool("changed")
+        load_tool_definitions(self.force_dir)
+        self.assertEqual(self.definitions.get("cached_tool_test").name, "changed")
+
+
+class TestToolRegistry(unittest.TestCase):
+    """Test cases for tool executor discovery."""
+
+    def setUp(self):
+        """Isolate the module-level tool registries."""
+        isolate_tool_registries(self)
+
+    def test_discovery_merges_entry_points_over_builtins(self):
+        """Test that plugin entry points add lazily loaded tools without displacing built-in executors."""
+        loaded = []
+
+        def load_plugin():
+            # The plugin class only exists once its module is imported, as with a real entry point
+            loaded.append(type("EntryPointExecutor", (BaseToolExecutor,), {"tool_id": "entry_point_test"}))
+            return loaded[-1]
+
+        plugin = Mock(value="plugin:EntryPointExecutor")
+        plugin.name = "entry_point_test"
+        plugin.load.side_effect = load_plugin
+        shadowing = Mock(value="plugin:GitStatus")
+        shadowing.name = "git_status"
+
+        with patch("force.tools._tool_entry_points", return_value=(plugin, shadowing)):
+            registry = ToolRegistry(Mock())
+            self.assertTrue(registry.has_executor("entry_point_test"))
+            plugin.load.assert_not_called()
+            self.assertIs(registry.get_executor_class("entry_point_test"), loaded[0])
+        plugin.load.assert_called_once()
+        shadowing.load.assert_not_called()
+        self.assertIs(registry.get_executor_class("git_status"), GitStatusExecutor)
+        tool_ids = {tool["id"] for tool in registry.get_available_tools()}
+        self.assertTrue({"entry_point_test", "git_status", "force_sync"} <= tool_ids)
+
+    def test_failed_discovery_is_retried(self):
+        """Test that a discovery that raises runs again on the next lookup."""
+        registry = ToolRegistry(Mock())
+        with patch("force.tools._tool_entry_points", side_effect=[RuntimeError("metadata"), ()]):
+            with self.assertRaises(RuntimeError):
+                registry.has_executor("git_status")
+            self.assertTrue(registry.has_executor("git_status"))
+
+    def test_undecorated_executors_still_discovered(self):
+        """Test that executors without @register_tool are registered with a deprecation warning."""
+        class UndecoratedExecutor(BaseToolExecutor):
+            tool_id = "undecorated_test"
+        # Drop the class from BaseToolExecutor.__subclasses__() once the test is done
+        self.addCleanup(gc.collect)
+
+        with patch("force.tools._tool_entry_points", return_value=()), \
+                self.assertLogs("force.tools", level="WARNING") as logs:
+            registry = ToolRegistry(Mock())
+            self.assertIs(registry.get_executor_class("undecorated_test"), UndecoratedExecutor)
+        self.assertTrue(any("UndecoratedExecutor was found without @register_tool" in line for line in logs.output))
+
+
+class TestForceComponentAutoFixer(unittest.TestCase):
+    """Test cases for the Force component auto-fixer."""
+
+    def setUp(self):
+        """Set up a temporary Force directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.force_dir = Path(self.temp_dir.name) / ".force"
+        (self.force_dir / "patterns").mkdir(parents=True)
+        self.fixer = ForceComponentAutoFixer(str(self.force_dir))
+
+    def _write_component(self, relative_path, data):
+        path = self.force_dir / relative_path
+        path.write_text(json.dumps(data))
+        return path
+
+    def test_fixes_only_changed_files(self):
+        """Test that complete components are left untouched and broken ones are fixed."""
+        complete = self._write_component("patterns/complete.json", {
+            "id": "complete", "name": "Complete", "description": "d", "category": "c",
+            "implementation": {"steps": [], "examples": []},
+            "metadata": {"created": "x", "updated": "x", "version": "1.0.0"}
+        })
+        original_text = complete.read_text()
+        broken = self._write_component("patterns/broken.json", {"$schema": "old", "id": "broken"})
+
+        self.assertFalse(self.fixer._fix_component_file(complete, "patterns"))
+        self.assertTrue(self.fixer._fix_component_file(broken, "patterns"))
+        self.assertEqual(complete.read_text(), original_text)
+
+        fixed = json.loads(broken.read_text())
+        self.assertNotIn("$schema", fixed)
+        self.assertEqual(fixed["implementation"], {"steps": [], "examples": []})
+
+    def test_fixes_large_file(self):
+        """Test that components above the memory-map threshold are fixed."""
+        large = self._write_component("patterns/large.json", {
+            "$schema": "old", "id": "large", "description": "x" * (300 * 1024)
+        })
+
+        self.assertTrue(self.fixer._fix_component_file(large, "patterns"))
+        fixed = json.loads(large.read_text())
+        self.assertNotIn("$schema", fixed)
+        self.assertEqual(len(fixed["description"]), 300 * 1024)
+
+    def test_snake_case_conversion(self):
+        """Test parameter name conversion to snake_case."""
+        cases = {
+            'filePath': 'file_path',
+            'HTTPServerURL': 'http_server_url',
+            'XMLHttpRequest': 'xml_http_request',
+            'already_snake': 'already_snake',
+            'max-depth value': 'max_depth_value',
+            '2ndPass': 'param_2nd_pass',
+            '__': 'param',
+        }
+        for name, expected in cases.items():
+            self.assertEqual(self.fixer._to_snake_case(name), expected)
+
+    def test_convert_old_parameters(self):
+        """Test conversion of old-format parameters to required/optional lists."""
+        converted = self.fixer._convert_old_parameters({
+            'filePath': {'type': 'string', 'enum': ['a'], 'default': 'a'},
+            'maxDepth': {'type': 'integer', 'description': 'Depth', 'required': True},
+        })
+        self.assertEqual(converted['required'], [
+            {'name': 'max_depth', 'type': 'integer', 'description': 'Depth'}
+        ])
+        self.assertEqual(converted['optional'], [
+            {'name': 'file_path', 'type': 'string', 'description': 'Parameter file_path',
+             'default': 'a', 'enum': ['a']}
+        ])
+        self.assertEqual(list(converted['optional'][0]), ['name', 'type', 'description', 'default', 'enum'])
+
+    def test_backup_keeps_original_contents(self):
+        """Test that the pre-fix backup is unaffected by the fixes."""
+        broken = self._write_component("patterns/broken.json", {"$schema": "old", "id": "broken"})
+        original_text = broken.read_text()
+
+        results = self.fixer.auto_fix_all_components()
+
+        self.assertEqual(results['files_modified'], ['patterns/broken.json'])
+        backup = Path(results['backup_location']) / "patterns" / "broken.json"
+        self.assertEqual(backup.read_text(), original_text)
+        self.assertNotEqual(broken.read_text(), original_text)
+
+    def test_backups_are_unique_snapshots(self):
+        """Test that backups made in the same second are separate and copy in-place data."""
+        (self.force_dir / "learning").mkdir()
+        learning = self.force_dir / "learning" / "data.json"
+        learning.write_text("{}")
+
+        first = self.fixer._create_backup()
+        second = self.fixer._create_backup()
+        self.assertNotEqual(first, second)
+
+        with open(learning, 'w') as f:
+            f.write('{"changed": true}')
+        self.assertEqual((first / "learning" / "data.json").read_text(), "{}")
+
+
+    def test_large_tree_fixed_in_process_by_default(self):
+        """Test that worker processes are only used when the fixer opts in."""
+        for index in range(PARALLEL_FIX_THRESHOLD):
+            self._write_component(f"patterns/p{index}.json", {"$schema": "old", "id": f"p{index}"})
+
+        with patch("force.system.force_component_auto_fixer.ProcessPoolExecutor") as pool:
+            results = self.fixer.auto_fix_all_components()
+
+        pool.assert_not_called()
+        self.assertEqual(results['files_fixed'], PARALLEL_FIX_THRESHOLD)
+        self.assertEqual(len(results['fixes_applied']), PARALLEL_FIX_THRESHOLD)
+
+
+@unittest.skipUnless(shutil.which("git"), "git is not installed")
+class TestToolExecutor(unittest.TestCase):
+    """Test cases for the built-in Force tool commands."""
+
+    def setUp(self):
+        """Set up a temporary git repository as the working directory."""
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.temp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(self.temp_dir.name)
+        subprocess.run(["git", "init", "-q"], check=True)
+        subprocess.run(["git", "config", "user.email", "test@example.com"], check=True)
+        subprocess.run(["git", "config", "user.name", "Test"], check=True)
+        self.executor = ToolExecutor(Mock())
+
+    def _run(self, coro):
+        loop = asyncio.new_event_loop()
+        try:
+            return loop.run_until_complete(coro)
+        finally:
+            loop.close()
+
+    def _committed_files(self):
+        output = subprocess.run(["git", "show", "--name-only", "--format=", "HEAD"],
+                                capture_output=True, text=True, check=True).stdout
+        return sorted(output.split("\n")[:-1])
+
+    def test_git_commit_stages_included_files(self):
+        """Test that included files are staged together and excluded ones are skipped."""
+        for name in ("a.txt", "b c.txt", "skip.txt"):
+            Path(name).write_text(name)
+
+        result = self._run(self.executor._execute_git_commit({
+            "message": "Add files",
+            "includeFiles": ["a.txt", "b c.txt", "skip.txt"],
+            "excludeFiles": ["skip.txt"],
+        }, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["files_staged"], ["a.txt", "b c.txt"])
+        self.assertEqual(len(result["commit_hash"]), 40)
+        self.assertEqual(self._committed_files(), ["a.txt", "b c.txt"])
+
+    def test_git_commit_stages_all_changes(self):
+        """Test that without an include list every change is staged, including paths with spaces."""
+        Path("tracked.txt").write_text("a")
+        subprocess.run(["git", "add", "tracked.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+        os.remove("tracked.txt")
+        Path("new file.txt").write_text("b")
+
+        result = self._run(self.executor._execute_git_commit({"message": "Update"}, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(sorted(result["files_staged"]), ["new file.txt", "tracked.txt"])
+        self.assertEqual(self._committed_files(), ["new file.txt", "tracked.txt"])
+
+    def test_git_commit_reports_clean_tree(self):
+        """Test that an include list on a clean tree reports no changes."""
+        Path("a.txt").write_text("a")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+
+        result = self._run(self.executor._execute_git_commit({"includeFiles": ["a.txt"]}, None))
+
+        self.assertFalse(result["success"])
+        self.assertIn("No changes to commit", result["error"])
+
+    def test_git_commit_skips_bad_include_path(self):
+        """Test that a missing include path does not block committing the others."""
+        Path("a.txt").write_text("a")
+
+        result = self._run(self.executor._execute_git_commit({
+            "message": "Add 'a' with $quotes",
+            "includeFiles": ["a.txt", "missing.txt"],
+        }, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(self._committed_files(), ["a.txt"])
+        message = subprocess.run(["git", "log", "-1", "--format=%s"],
+                                 capture_output=True, text=True, check=True).stdout.strip()
+        self.assertEqual(message, "Add 'a' with $quotes")
+
+    def test_git_branch_detects_existing_branch(self):
+        """Test branch creation and the existing-branch check through the git helper."""
+        Path("a.txt").write_text("a")
+        subprocess.run(["git", "add", "a.txt"], check=True)
+        subprocess.run(["git", "commit", "-q", "-m", "init"], check=True)
+
+        async def create_twice():
+            try:
+                parameters = {"branchName": "topic", "baseBranch": "HEAD"}
+                first = await self.executor._execute_git_branch(parameters, None)
+                second = await self.executor._execute_git_branch(parameters, None)
+                return first, second
+            finally:
+                await self.executor.aclose()
+
+        first, second = self._run(create_twice())
+        self.assertTrue(first["success"], first.get("error"))
+        self.assertEqual(first["branch_name"], "feature/topic")
+        self.assertFalse(second["success"])
+        self.assertIn("already exists", second["error"])
+
+    def test_concurrent_git_queries_share_one_helper(self):
+        """Test that concurrent first queries spawn a single git helper, which the context manager stops."""
+        spawn = asyncio.create_subprocess_exec
+
+        async def query_concurrently():
+            with patch("force.tool_executor.asyncio.create_subprocess_exec", side_effect=spawn) as spawned:
+                async with self.executor:
+                    answers = await asyncio.gather(*(self.executor._git_object_exists("HEAD") for _ in range(4)))
+                    helper = self.executor._git_helper
+            return answers, spawned.call_count, helper
+
+        answers, spawn_count, helper = self._run(query_concurrently())
+        self.assertEqual(answers, [False] * 4)
+        self.assertEqual(spawn_count, 1)
+        self.assertIsNotNone(helper.returncode)
+        self.assertIsNone(self.executor._git_helper)
+
+    def test_doc_analysis_reports_issues_in_file_order(self):
+        """Test that documentation files are analyzed and reported in order."""
+        Path("README.md").write_text("Intro without header")
+        Path("EMPTY.md").write_text("")
+
+        result = self._run(self.executor._execute_doc_analysis({
+            "targetFiles": ["README.md", "EMPTY.md", "MISSING.md"],
+        }, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["files_analyzed"], ["README.md", "EMPTY.md"])
+        self.assertEqual([(issue["file"], issue["type"]) for issue in result["issues_found"]], [
+            ("README.md", "missing_header"),
+            ("EMPTY.md", "empty_file"),
+            ("EMPTY.md", "missing_header"),
+        ])
+        self.assertEqual(result["report"]["issue_breakdown"], {"missing_header": 2, "empty_file": 1})
+        self.assertEqual(result["report"]["files_with_issues"], 2)
+
+    def test_doc_analysis_reports_unreadable_files(self):
+        """Test that a documentation file that cannot be read is reported, not dropped."""
+        issues, files_with_issues = _analyze_doc_files(["GONE.md"])
+        self.assertEqual([(issue["file"], issue["type"]) for issue in issues], [("GONE.md", "read_error")])
+        self.assertEqual(files_with_issues, {"GONE.md"})
+
+    def test_project_analysis_naming_skips_excluded_dirs(self):
+        """Test that the naming scan finds hyphenated modules outside pruned directories."""
+        for directory in ("pkg", ".venv", "node_modules"):
+            os.mkdir(directory)
+            Path(directory, "bad-name.py").write_text("")
+        Path("good_name.py").write_text("")
+
+        result = self._run(self.executor._execute_project_analysis({
+            "checkStructure": False, "suggestImprovements": False,
+        }, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual([issue["file"] for issue in result["naming_issues"]],
+                         [os.path.join(".", "pkg", "bad-name.py")])
+
+    def test_project_analysis_structure_checks(self):
+        """Test that expected files are found and that a trailing slash requires a directory."""
+        Path("setup.py").write_text("")
+        Path("tests").write_text("")
+
+        result = self._run(self.executor._execute_project_analysis({
+            "projectType": "library", "checkNaming": False,
+        }, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual([issue["file"] for issue in result["structure_issues"]],
+                         ["requirements.txt", "README.md", "__init__.py", "tests/"])
+        self.assertEqual([s["type"] for s in result["suggestions"]], ["add_gitignore"])
+
+    def test_subprocess_concurrency_is_bounded(self):
+        """Test that the engine's subprocess cap serialises concurrent commands."""
+        executor = ToolExecutor(Mock(max_subprocess_concurrency=1))
+        argv = [sys.executable, "-c", "import time; time.sleep(0.1)"]
+
+        async def run_three():
+            return await asyncio.gather(*(executor._run_command(argv) for _ in range(3)))
+
+        started = time.monotonic()
+        results = self._run(run_three())
+
+        self.assertEqual([r["returncode"] for r in results], [0, 0, 0])
+        self.assertGreaterEqual(time.monotonic() - started, 0.3)
+
+    def test_pyflakes_messages_get_flake8_codes(self):
+        """Test that in-process pyflakes messages are reported with their F codes."""
+        UnusedImport = type("UnusedImport", (), {})
+        message = UnusedImport()
+        message.filename, message.lineno, message.col = "mod.py", 1, 0
+        message.message, message.message_args = "%r imported but unused", ("os",)
+
+        collector = _PyflakesCollector()
+        collector.flake(message)
+
+        self.assertEqual(collector.issues, [{
+            "linter": "pyflakes", "message": "mod.py:1:1: F401 'os' imported but unused",
+            "file": "mod.py", "line": 1, "column": 1, "code": "F401"
+        }])
+
+    def test_pyflakes_skipped_when_not_installed(self):
+        """Test that the opt-in pyflakes linter is skipped without pyflakes."""
+        with patch("force.tool_executor.PYFLAKES_AVAILABLE", False):
+            result = self._run(self.executor._execute_code_quality({"linters": ["pyflakes"]}, None))
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["linters_run"], [])
+
+    @unittest.skipUnless(PYFLAKES_AVAILABLE, "pyflakes not installed")
+    def test_code_quality_runs_pyflakes_in_process(self):
+        """Test the opt-in pyflakes linter over the project's Python files."""
+        Path("mod.py").write_text("import os\n")
+        os.mkdir("build")
+        Path("build", "lib.py").write_text("import os\n")
+
+        result = self._run(self.executor._execute_code_quality({"linters": ["pyflakes"]}, None))
+
+        self.assertTrue(result["success"], result.get("error"))
+        self.assertEqual(result["linters_run"], ["pyflakes"])
+        self.assertEqual([(issue["file"], issue["line"], issue.get("code")) for issue in result["issues_found"]],
+                         [(os.path.join(".", "mod.py"), 1, "F401")])
+
+
 class TestLegacyAgentIntegration(unittest.TestCase):
     """Test cases for legacy agent integration."""
     
@@ -125,6 +643,84 @@ class TestLegacyAgentIntegration(unittest.TestCase):
         self.assertIsInstance(capabilities, list)
         self.assertGreater(len(capabilities), 0)
 
+    def test_adapter_mappings(self):
+        """Test that adapter mappings extend the base mappings."""
+        self.assertEqual(VCMAForceAdapter._pattern_mapping['analyze'], 'git-analysis-workflow')
+        self.assertEqual(VCMAForceAdapter._pattern_mapping['monitor'], 'monitoring-workflow')
+        self.assertEqual(VCMAForceAdapter._capability_mapping['status'], 'get_agent_status')
+        self.assertIn('repo_status', VCMAForceAdapter._tool_mapping)
+
+    def test_learning_data_is_bounded(self):
+        """Test that adapters only retain the most recent learning records."""
+        adapter = self.manager.get_agent_adapter('VCMA')
+        for i in range(150):
+            adapter._learning_data.append({"tool": f"tool-{i}", "duration": 0.0})
+
+        loop = asyncio.new_event_loop()
+        try:
+            learning = loop.run_until_complete(adapter.collect_learning_data())
+        finally:
+            loop.close()
+
+        records = learning["learning_records"]
+        self.assertEqual(len(records), 100)
+        self.assertEqual(records[0]["tool"], "tool-50")
+        self.assertEqual(records[-1]["tool"], "tool-149")
+
+    def test_performance_metrics(self):
+        """Test running duration metrics over the execution history."""
+        adapter = self.manager.get_agent_adapter('VCMA')
+        self.assertEqual(adapter._get_performance_metrics(), {})
+
+        for duration in (0.5, 0.1, 0.9):
+            adapter._record_execution({"tool": "git-status", "duration": duration, "success": True})
+
+        metrics = adapter._get_performance_metrics()
+        self.assertAlmostEqual(metrics["average_duration"], 0.5)
+        self.assertEqual(metrics["min_duration"], 0.1)
+        self.assertEqual(metrics["max_duration"], 0.9)
+        self.assertEqual(metrics["total_executions"], 3)
+
+    def test_constraints_follow_file_changes(self):
+        """Test that constraints keep file order and pick up edited files."""
+        adapter = self.manager.get_agent_adapter('VCMA')
+        temp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(temp_dir.cleanup)
+        constraint_file = Path(temp_dir.name) / "rules.json"
+
+        def write_constraints(*constraints):
+            constraint_file.write_text(json.dumps({"constraints": list(constraints)}))
+
+        write_constraints({"name": "global", "applies_to": ["all"]}, {"name": "commit", "applies_to": ["commit"]})
+        loop = asyncio.new_event_loop()
+        self.addCleanup(loop.close)
+        with patch.object(adapter.force_engine, "constraints_dir", Path(temp_dir.name)):
+            constraints = loop.run_until_complete(adapter._load_applicable_constraints("commit"))
+            self.assertEqual([c["name"] for c in constraints], ["global", "commit"])
+
+            write_constraints({"name": "global", "applies_to": ["all"]}, {"name": "push", "applies_to": ["commit", "push"]})
+            constraints = loop.run_until_complete(adapter._load_applicable_constraints("commit"))
+            self.assertEqual([c["name"] for c in constraints], ["global", "push"])
+
+    def test_condition_evaluation(self):
+        """Test adapter condition evaluation."""
+        adapter = self.manager.get_agent_adapter('VCMA')
+        context = {"branch": "main", "changes": 3}
+
+        self.assertTrue(adapter._evaluate_condition({"type": "equals", "field": "branch", "value": "main"}, context))
+        self.assertTrue(adapter._evaluate_condition({"type": "exists", "field": "changes"}, context))
+        self.assertTrue(adapter._evaluate_condition({"type": "greater_than", "field": "changes", "value": 2}, context))
+        self.assertFalse(adapter._evaluate_condition({"type": "greater_than", "field": "branch", "value": 2}, context))
+        self.assertFalse(adapter._evaluate_condition({"type": "unknown", "field": "branch"}, context))
+        self.assertFalse(adapter._evaluate_condition({"type": "exists"}, context))
+        self.assertFalse(adapter._evaluate_condition({"type": ["equals"], "field": "branch", "value": "main"}, context))
+
+        # A definition edited in place is evaluated with its new contents
+        condition = {"type": "equals", "field": "branch", "value": "main"}
+        self.assertTrue(adapter._evaluate_condition(condition, context))
+        condition["value"] = "develop"
+        self.assertFalse(adapter._evaluate_condition(condition, context))
+
 
 class TestYUNGIntegration(unittest.TestCase):
     """Test cases for YUNG command integration."""
@@ -232,6 +828,11 @@ def run_tests():
     
     # Add test cases
     suite.addTest(unittest.makeSuite(TestForceEngine))
+    suite.addTest(unittest.makeSuite(TestPatternRegistry))
+    suite.addTest(unittest.makeSuite(TestToolDefinitionLoading))
+    suite.addTest(unittest.makeSuite(TestToolRegistry))
+    suite.addTest(unittest.makeSuite(TestForceComponentAutoFixer))
+    suite.addTest(unittest.makeSuite(TestToolExecutor))
     suite.addTest(unittest.makeSuite(TestLegacyAgentIntegration))
     suite.addTest(unittest.makeSuite(TestYUNGIntegration))
     suite.addTest(unittest.makeSuite(TestForceSystemIntegration))